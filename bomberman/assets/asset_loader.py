@@ -4,10 +4,21 @@ Asset Loader - Loads and manages game assets (images, sounds)
 Uses Singleton pattern to ensure assets are loaded only once
 """
 
+import math
 import pygame
 import os
 from patterns.creational.singleton import DatabaseConnection
 
+# Unit-circle vertices for the 10-point fallback star; trig runs once at
+# import instead of on every _create_star_surface call
+_STAR_UNIT_10 = [(math.cos(i * math.pi / 5 - math.pi / 2),
+                  math.sin(i * math.pi / 5 - math.pi / 2))
+                 for i in range(10)]
+
+# Center-distance field shared by all fallback explosion frames, built on
+# first use (numpy is only needed when the pre-generated frames are missing)
+_EXPLOSION_DIST = None
+
 
 class AssetLoader:
     """
@@ -15,31 +26,48 @@ class AssetLoader:
     Assets are loaded once and cached for performance.
     """
     _instance = None
-    _initialized = False
 
     def __new__(cls):
+        # All setup lives here so repeat AssetLoader() calls cost only the
+        # _instance check, with no per-call __init__/_initialized branch
         if cls._instance is None:
-            cls._instance = super(AssetLoader, cls).__new__(cls)
+            instance = super(AssetLoader, cls).__new__(cls)
+            instance.images = {}
+            instance.sounds = {}
+            instance._image_factories = {}
+            instance._transform_cache = {}
+            instance._atlas_pending = False
+            instance._loaded_from_cache = False
+            instance._load_assets()
+            cls._instance = instance
         return cls._instance
 
-    def __init__(self):
-        if not self._initialized:
-            self.images = {}
-            self.sounds = {}
-            self._load_assets()
-            AssetLoader._initialized = True
+    # Derived sprites are composed from base images at runtime, so they are
+    # registered on every load path and never serialized to the pixel cache
+    _DERIVED_SPRITES = ('bomb_frames',)
+
+    # Vertical padding above the bomb sprite so the longest fuse fits
+    FUSE_PAD = 6
 
     def _load_assets(self):
         """Load all game assets"""
         print("📦 Loading assets...")
         self._load_sounds()
         self._create_default_images()
+        self._image_factories['bomb_frames'] = self._create_bomb_frames
         print("✅ Assets loaded successfully!\n")
 
     def _load_sounds(self):
         """Load sound effects"""
         try:
-            pygame.mixer.init()
+            # Match the generated WAVs (22050 Hz mono 16-bit) so pygame
+            # never resamples; the small buffer cuts playback latency.
+            # pygame.init() may already have opened the mixer at the
+            # 44100 Hz default, in which case it has to be reopened.
+            pygame.mixer.pre_init(22050, -16, 1, 256)
+            if pygame.mixer.get_init() not in (None, (22050, -16, 1)):
+                pygame.mixer.quit()
+            pygame.mixer.init(22050, -16, 1, 256)
 
             sound_files = {
                 'bomb_place': 'assets/sounds/bomb_place.wav',
@@ -60,10 +88,40 @@ class AssetLoader:
             print(f"  ⚠️  Sound system error: {e}")
 
     def _create_default_images(self):
-        """Load sprite images from files"""
-        print("  🎨 Loading sprites...")
+        """
+        Register sprite factories for lazy loading.
+
+        Nothing is decoded here; each sprite is loaded (or procedurally
+        generated as a fallback) on its first get_image() call, so startup
+        cost no longer scales with the number of assets.
+        """
+        print("  🎨 Registering sprites (lazy load)...")
+
+        # One scandir per directory instead of one stat syscall per sprite
+        present = {
+            directory: self._scan_dir(f'assets/images/{directory}'.rstrip('/'))
+            for directory in ('', 'players', 'bombs', 'powerups',
+                              'enemies', 'walls', 'explosions')
+        }
+
+        def _on_disk(path):
+            head, name = os.path.split(path)
+            directory = os.path.basename(head)
+            return name in present.get('' if directory == 'images' else directory, ())
+
+        # Fastest path: raw pixel cache written by a previous run; one
+        # sequential read, no PNG decodes at all
+        if 'assets_cache.bin' in present[''] and self._load_cache():
+            self._loaded_from_cache = True
+            return
 
-        # Try to load generated sprites
+        # Prefer the texture atlas: one file open + decode, done on first use
+        if 'atlas.png' in present[''] and 'atlas.json' in present['']:
+            self._atlas_pending = True
+            print("  ✅ Atlas found, sprites will load on first use")
+            return
+
+        # Register per-file loaders for generated sprites
         sprite_files = {
             # Players
             'player1': 'assets/images/players/player1.png',
@@ -85,47 +143,192 @@ class AssetLoader:
             'enemy_intelligent': 'assets/images/enemies/intelligent.png',
         }
 
-        loaded_count = 0
         for name, path in sprite_files.items():
-            if os.path.exists(path):
-                self.images[name] = pygame.image.load(path).convert_alpha()
-                loaded_count += 1
+            if _on_disk(path):
+                self._image_factories[name] = \
+                    lambda p=path: pygame.image.load(p).convert_alpha()
             else:
                 # Fallback to simple colored circle
                 size = 40 if 'player' in name or 'enemy' in name or 'bomb' in name else 30
                 color = self._get_fallback_color(name)
-                self.images[name] = self._create_circle_surface(size, color)
+                self._image_factories[name] = \
+                    lambda s=size, c=color: self._create_circle_surface(s, c)
 
-        # Load wall sprites for all themes
+        # Register wall sprites for all themes
         for theme in ['desert', 'forest', 'city']:
             for wall_type in ['unbreakable', 'breakable', 'hard']:
                 key = f'wall_{theme}_{wall_type}'
                 path = f'assets/images/walls/{theme}_{wall_type}.png'
-                if os.path.exists(path):
-                    self.images[key] = pygame.image.load(path).convert_alpha()
-                    loaded_count += 1
+                if _on_disk(path):
+                    self._image_factories[key] = \
+                        lambda p=path: pygame.image.load(p).convert_alpha()
                 else:
-                    self.images[key] = self._create_simple_wall(wall_type, theme)
-
-        # Load explosion animation frames
-        self.images['explosion_frames'] = []
+                    self._image_factories[key] = \
+                        lambda w=wall_type, t=theme: self._create_simple_wall(w, t)
+
+        # Explosion frames load as one list on first use
+        self._image_factories['explosion_frames'] = self._load_explosion_frames
+
+        print(f"  ✅ Registered {len(self._image_factories)} sprites")
+
+    @staticmethod
+    def _scan_dir(path):
+        """File names in a directory via one scandir (empty set if missing)"""
+        if not os.path.isdir(path):
+            return frozenset()
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+
+    def _load_explosion_frames(self):
+        """Load or generate the 8 explosion animation frames"""
+        frames = []
+        available = self._scan_dir('assets/images/explosions')
         for i in range(8):
-            path = f'assets/images/explosions/explosion_{i}.png'
-            if os.path.exists(path):
-                frame = pygame.image.load(path).convert_alpha()
-                self.images['explosion_frames'].append(frame)
-                loaded_count += 1
+            name = f'explosion_{i}.png'
+            if name in available:
+                frames.append(pygame.image.load(f'assets/images/explosions/{name}').convert_alpha())
             else:
                 # Create simple expanding circle
-                frame = self._create_explosion_frame(i)
-                self.images['explosion_frames'].append(frame)
+                frames.append(self._create_explosion_frame(i))
+        return frames
 
-        if loaded_count > 0:
-            print(f"  ✅ Loaded {loaded_count} sprite files")
-        else:
-            print(f"  ⚠️  No sprites found, using fallback graphics")
+    def _load_atlas(self):
+        """
+        Load all sprites from the single texture atlas if it exists.
+
+        Images become subsurface views into one shared Surface, so loading
+        costs one file open and one PNG decode instead of ~30.
+
+        Returns:
+            bool: True if the atlas was loaded successfully
+        """
+        atlas_path = 'assets/images/atlas.png'
+        manifest_path = 'assets/images/atlas.json'
 
-        print(f"  ✅ Total images: {len(self.images)}")
+        if not (os.path.exists(atlas_path) and os.path.exists(manifest_path)):
+            return False
+
+        try:
+            import json
+            with open(manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+
+            atlas_surface = pygame.image.load(atlas_path).convert_alpha()
+
+            explosion_frames = {}
+            for name, (x, y, w, h) in manifest.items():
+                view = atlas_surface.subsurface((x, y, w, h))
+                if name.startswith('explosion_'):
+                    explosion_frames[int(name.split('_')[1])] = view
+                else:
+                    self.images[name] = view
+
+            self.images['explosion_frames'] = [explosion_frames[i]
+                                               for i in sorted(explosion_frames)]
+
+            print(f"  ✅ Loaded {len(manifest)} sprites from atlas")
+            return True
+        except Exception as e:
+            print(f"  ⚠️  Atlas load failed: {e}")
+            return False
+
+    _CACHE_PATH = 'assets/images/assets_cache.bin'
+
+    def _load_cache(self):
+        """
+        Load all sprites from the raw pixel cache written by save_cache().
+
+        The file is a small JSON manifest ({name: (w, h, offset, length)})
+        followed by raw RGBA blobs, so loading is one sequential read plus
+        frombytes per sprite — no PNG decoding. A cache older than any
+        sprite directory is considered stale and ignored.
+
+        Returns:
+            bool: True if the cache was loaded successfully
+        """
+        try:
+            import json
+            import struct
+
+            cache_mtime = os.path.getmtime(self._CACHE_PATH)
+            for directory in ('', 'players', 'bombs', 'powerups',
+                              'enemies', 'walls', 'explosions'):
+                path = f'assets/images/{directory}'.rstrip('/')
+                if os.path.isdir(path) and os.path.getmtime(path) > cache_mtime:
+                    return False
+
+            with open(self._CACHE_PATH, 'rb') as cache_file:
+                manifest_size, = struct.unpack('<I', cache_file.read(4))
+                manifest = json.loads(cache_file.read(manifest_size))
+                blobs = cache_file.read()
+
+            explosion_frames = {}
+            for name, (w, h, offset, length) in manifest.items():
+                surface = pygame.image.frombytes(
+                    blobs[offset:offset + length], (w, h), 'RGBA')
+                surface = self._match_display_format(surface)
+                if name.startswith('explosion_'):
+                    explosion_frames[int(name.split('_')[1])] = surface
+                else:
+                    self.images[name] = surface
+
+            if explosion_frames:
+                self.images['explosion_frames'] = [explosion_frames[i]
+                                                   for i in sorted(explosion_frames)]
+
+            print(f"  ✅ Loaded {len(manifest)} sprites from pixel cache")
+            return True
+        except Exception as e:
+            print(f"  ⚠️  Pixel cache load failed: {e}")
+            return False
+
+    def save_cache(self):
+        """
+        Serialize every sprite to assets_cache.bin so later runs skip
+        regeneration and PNG decoding entirely.
+
+        Called at shutdown; a no-op when this run's sprites came from the
+        cache, since rewriting would produce the identical file.
+        """
+        if self._loaded_from_cache:
+            return
+
+        import json
+        import struct
+
+        # Materialize anything still pending behind a factory or the atlas
+        for name in list(self._image_factories):
+            if name not in self._DERIVED_SPRITES:
+                self.get_image(name)
+        if self._atlas_pending:
+            self._atlas_pending = False
+            self._load_atlas()
+
+        manifest = {}
+        blobs = []
+        offset = 0
+        for name, image in self.images.items():
+            if name in self._DERIVED_SPRITES:
+                continue
+            if name == 'explosion_frames':
+                entries = [(f'explosion_{i}', frame)
+                           for i, frame in enumerate(image)]
+            else:
+                entries = [(name, image)]
+            for entry_name, surface in entries:
+                data = pygame.image.tobytes(surface, 'RGBA')
+                manifest[entry_name] = (*surface.get_size(), offset, len(data))
+                blobs.append(data)
+                offset += len(data)
+
+        manifest_bytes = json.dumps(manifest).encode()
+        os.makedirs(os.path.dirname(self._CACHE_PATH), exist_ok=True)
+        with open(self._CACHE_PATH, 'wb') as cache_file:
+            cache_file.write(struct.pack('<I', len(manifest_bytes)))
+            cache_file.write(manifest_bytes)
+            cache_file.writelines(blobs)
+
+        print(f"  ✅ Cached {len(manifest)} sprites to {self._CACHE_PATH}")
 
     def _get_fallback_color(self, name):
         """Get fallback color for sprites"""
@@ -142,57 +345,160 @@ class AssetLoader:
         }
         return color_map.get(name, (255, 255, 255))
 
+    @staticmethod
+    def _match_display_format(surface, opaque=False):
+        """
+        Convert a procedural surface to the display pixel format.
+
+        Sprites loaded from PNG get this via convert_alpha(); without it the
+        fallback surfaces pay a per-pixel format conversion on every blit.
+        Requires a display mode, so it is a no-op before set_mode().
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert() if opaque else surface.convert_alpha()
+
     def _create_simple_wall(self, wall_type, theme):
         """Create simple wall sprite"""
-        from config import THEMES
-        theme_colors = THEMES.get(theme, THEMES['desert'])
-
-        color_key = f'{wall_type}_color'
-        color = theme_colors.get(color_key, (128, 128, 128))
+        from config import Theme, THEME_COLORS, WALL_COLOR_INDEX
+        theme_colors = THEME_COLORS[getattr(Theme, theme.upper(), Theme.DESERT)]
+        color = theme_colors[WALL_COLOR_INDEX.get(wall_type, WALL_COLOR_INDEX['bg'])]
 
         surface = pygame.Surface((40, 40))
         surface.fill(color)
         pygame.draw.rect(surface, (0, 0, 0), (0, 0, 40, 40), 2)
-        return surface
+        return self._match_display_format(surface, opaque=True)
 
     def _create_explosion_frame(self, frame_num):
         """Create simple explosion frame"""
-        surface = pygame.Surface((40, 40), pygame.SRCALPHA)
+        import numpy as np
+
+        global _EXPLOSION_DIST
+        if _EXPLOSION_DIST is None:
+            yy, xx = np.ogrid[:40, :40]
+            _EXPLOSION_DIST = np.hypot(xx - 20, yy - 20)
+
+        # One masked RGBA assignment replaces the alpha-modulated circle draw
         progress = frame_num / 8
-        radius = int(20 * progress)
-        alpha = int(255 * (1 - progress))
-        color = (255, int(255 * (1 - progress)), 0, alpha)
-        pygame.draw.circle(surface, color, (20, 20), radius)
-        return surface
+        fade = int(255 * (1 - progress))
+        rgba = np.zeros((40, 40, 4), dtype=np.uint8)
+        rgba[_EXPLOSION_DIST <= int(20 * progress)] = (255, fade, 0, fade)
+
+        surface = pygame.image.frombytes(rgba.tobytes(), (40, 40), 'RGBA')
+        return self._match_display_format(surface)
+
+    def _create_bomb_frames(self):
+        """
+        Pre-bake the bomb sprite with each of the 11 fuse lengths.
+
+        The fuse quantizes to int(timer / BOMB_TIMER * 10), so every
+        possible fuse line + spark combination is composited onto a copy
+        of the base sprite once; Bomb.draw then does a single blit per
+        frame instead of rasterizing line and circle every frame.
+
+        Returns:
+            list: 11 surfaces indexed by fuse length, or None without a
+                base bomb sprite
+        """
+        base = self.get_image('bomb')
+        if base is None:
+            return None
+
+        width, height = base.get_size()
+        center_x = width // 2
+        # Matches the screen-space fuse anchor (centery - TILE_SIZE // 3),
+        # shifted down by the padding that keeps the longest fuse in-bounds
+        fuse_base_y = height // 2 - height // 3 + self.FUSE_PAD
+
+        frames = []
+        for fuse_length in range(11):
+            frame = pygame.Surface((width, height + self.FUSE_PAD),
+                                   pygame.SRCALPHA)
+            frame.blit(base, (0, self.FUSE_PAD))
+            if fuse_length > 0:
+                tip_y = fuse_base_y - fuse_length
+                pygame.draw.line(frame, (255, 100, 0),
+                                 (center_x, fuse_base_y), (center_x, tip_y), 2)
+                pygame.draw.circle(frame, (255, 200, 0), (center_x, tip_y), 2)
+            frames.append(self._match_display_format(frame))
+        return frames
 
     def _create_circle_surface(self, size, color):
         """Create a circular surface"""
         surface = pygame.Surface((size, size), pygame.SRCALPHA)
         pygame.draw.circle(surface, color, (size // 2, size // 2), size // 2)
-        return surface
+        return self._match_display_format(surface)
 
     def _create_star_surface(self, size, color):
         """Create a star-shaped surface for power-ups"""
         surface = pygame.Surface((size, size), pygame.SRCALPHA)
 
-        # Draw a simple star
+        # Draw a simple star from the precomputed unit vertices
         center = size // 2
-        points = []
-        import math
-
-        for i in range(10):
-            angle = (i * math.pi / 5) - (math.pi / 2)
-            radius = center if i % 2 == 0 else center // 2
-            x = center + int(radius * math.cos(angle))
-            y = center + int(radius * math.sin(angle))
-            points.append((x, y))
+        points = [(center + int((center if i % 2 == 0 else center // 2) * ux),
+                   center + int((center if i % 2 == 0 else center // 2) * uy))
+                  for i, (ux, uy) in enumerate(_STAR_UNIT_10)]
 
         pygame.draw.polygon(surface, color, points)
-        return surface
+        return self._match_display_format(surface)
 
     def get_image(self, name):
-        """Get an image by name"""
-        return self.images.get(name)
+        """Get an image by name, loading it on first access"""
+        image = self.images.get(name)
+        if image is not None:
+            return image
+
+        if self._atlas_pending:
+            self._atlas_pending = False
+            self._load_atlas()
+            image = self.images.get(name)
+            if image is not None:
+                return image
+            # Derived sprites live behind factories, not in the atlas
+
+        factory = self._image_factories.pop(name, None)
+        if factory is not None:
+            image = factory()
+            self.images[name] = image
+        return image
+
+    # Rotating/tinting per frame re-runs pygame.transform for every draw;
+    # cap the cache so pathological angle spam can't grow it unbounded
+    _TRANSFORM_CACHE_MAX = 256
+
+    def get_transformed(self, name, angle=0, tint=None):
+        """
+        Get a rotated and/or tinted variant of an image, cached by
+        (name, angle, tint) so each variant is computed only once.
+
+        Args:
+            name (str): Base image name
+            angle (float): Rotation in degrees (counterclockwise)
+            tint (tuple): Optional RGBA color multiplied into the sprite
+
+        Returns:
+            pygame.Surface: The transformed surface (shared; do not mutate)
+        """
+        key = (name, angle, tint)
+        surface = self._transform_cache.get(key)
+        if surface is not None:
+            return surface
+
+        base = self.get_image(name)
+        if base is None:
+            return None
+
+        if angle:
+            surface = pygame.transform.rotate(base, angle)
+        else:
+            surface = base.copy()
+        if tint:
+            surface.fill(tint, special_flags=pygame.BLEND_RGBA_MULT)
+
+        if len(self._transform_cache) >= self._TRANSFORM_CACHE_MAX:
+            self._transform_cache.clear()
+        self._transform_cache[key] = surface
+        return surface
 
     def get_sound(self, name):
         """Get a sound by name"""
@@ -215,12 +521,26 @@ _asset_loader = None
 
 def get_asset_loader():
     """Get the global asset loader instance"""
-    global _asset_loader
+    global _asset_loader, get_image, get_sound
     if _asset_loader is None:
         _asset_loader = AssetLoader()
+        # Rebind the module-level shortcuts to the loader's bound methods so
+        # hot paths skip the get_asset_loader() call + attribute lookup
+        get_image = _asset_loader.get_image
+        get_sound = _asset_loader.get_sound
     return _asset_loader
 
 
+def get_image(name):
+    """Module-level image lookup; becomes a bound method after first init"""
+    return get_asset_loader().get_image(name)
+
+
+def get_sound(name):
+    """Module-level sound lookup; becomes a bound method after first init"""
+    return get_asset_loader().get_sound(name)
+
+
 # Test
 if __name__ == "__main__":
     pygame.init()
@@ -7,8 +7,56 @@ Run this once to create placeholder sounds
 import numpy as np
 import wave
 import os
+from concurrent.futures import ProcessPoolExecutor
 os.makedirs("assets/sounds", exist_ok=True)
 
+_rng = np.random.default_rng()
+
+
+def _noise_burst(samples, decay, volume):
+    """
+    Generate enveloped white noise directly into an int16 buffer.
+
+    Works in float32 and writes the final scale+cast with np.multiply(out=...)
+    so the ~11k-sample buffer is traversed twice instead of four times.
+
+    Args:
+        samples (int): Number of samples
+        decay (float): Exponential decay rate of the envelope
+        volume (float): Volume (0.0 to 1.0)
+
+    Returns:
+        np.ndarray: int16 sample buffer
+    """
+    noise = _rng.uniform(-1, 1, samples).astype(np.float32, copy=False)
+    noise *= np.exp(-decay * np.linspace(0, 1, samples, dtype=np.float32))
+
+    out = np.empty(samples, dtype=np.int16)
+    np.multiply(noise, volume * 32767, out=out, casting='unsafe')
+    return out
+
+
+def _write_wav(filename, wave_data, sample_rate=22050):
+    """
+    Write a mono 16-bit WAV in a single pass.
+
+    One writeframes call hands the whole int16 buffer to the file in one
+    write instead of the many small buffered writes the generators used
+    to issue individually.
+
+    Args:
+        filename (str): Output filename
+        wave_data (np.ndarray): int16 sample buffer
+        sample_rate (int): Sample rate in Hz
+    """
+    with wave.open(filename, 'w') as wav_file:
+        wav_file.setnchannels(1)  # Mono
+        wav_file.setsampwidth(2)  # 16-bit
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(wave_data.tobytes())
+
+    print(f"✅ Generated: {filename}")
+
 
 
 def generate_beep(filename, frequency, duration, volume=0.3):
@@ -38,14 +86,7 @@ def generate_beep(filename, frequency, duration, volume=0.3):
     # Convert to 16-bit integers
     wave_data = (wave_data * 32767).astype(np.int16)
 
-    # Save as WAV file
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1)  # Mono
-        wav_file.setsampwidth(2)  # 16-bit
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(wave_data.tobytes())
-
-    print(f"✅ Generated: {filename}")
+    _write_wav(filename, wave_data, sample_rate)
 
 
 def generate_explosion(filename, duration=0.5, volume=0.4):
@@ -53,22 +94,10 @@ def generate_explosion(filename, duration=0.5, volume=0.4):
     sample_rate = 22050
     samples = int(sample_rate * duration)
 
-    # Generate white noise
-    noise = np.random.uniform(-1, 1, samples)
-
-    # Apply exponential decay envelope
-    envelope = np.exp(-5 * np.linspace(0, 1, samples))
+    # White noise shaped by exponential decay, in one fused pass
+    wave_data = _noise_burst(samples, decay=5, volume=volume)
 
-    wave_data = noise * envelope * volume
-    wave_data = (wave_data * 32767).astype(np.int16)
-
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(wave_data.tobytes())
-
-    print(f"✅ Generated: {filename}")
+    _write_wav(filename, wave_data, sample_rate)
 
 
 def generate_powerup(filename, duration=0.3, volume=0.3):
@@ -79,21 +108,18 @@ def generate_powerup(filename, duration=0.3, volume=0.3):
     notes = [523, 659, 784]  # C, E, G
     note_duration = duration / len(notes)
 
-    wave_data = np.array([], dtype=np.int16)
+    # Preallocate the full buffer and fill per-note slices; repeated
+    # np.concatenate would copy the accumulated data on every note
+    samples_per_note = int(sample_rate * note_duration)
+    wave_data = np.empty(samples_per_note * len(notes), dtype=np.int16)
 
-    for freq in notes:
-        t = np.linspace(0, note_duration, int(sample_rate * note_duration))
-        note = np.sin(2 * np.pi * freq * t) * volume
-        note = (note * 32767).astype(np.int16)
-        wave_data = np.concatenate([wave_data, note])
+    t = np.linspace(0, note_duration, samples_per_note, dtype=np.float32)
+    for i, freq in enumerate(notes):
+        note_slice = wave_data[i * samples_per_note:(i + 1) * samples_per_note]
+        np.multiply(np.sin(2 * np.pi * freq * t), volume * 32767,
+                    out=note_slice, casting='unsafe')
 
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(wave_data.tobytes())
-
-    print(f"✅ Generated: {filename}")
+    _write_wav(filename, wave_data, sample_rate)
 
 
 def generate_death(filename, duration=0.4, volume=0.3):
@@ -113,13 +139,7 @@ def generate_death(filename, duration=0.4, volume=0.3):
 
     wave_data = (wave_data * 32767).astype(np.int16)
 
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(wave_data.tobytes())
-
-    print(f"✅ Generated: {filename}")
+    _write_wav(filename, wave_data, sample_rate)
 
 
 def generate_wall_break(filename, duration=0.2, volume=0.3):
@@ -127,22 +147,10 @@ def generate_wall_break(filename, duration=0.2, volume=0.3):
     sample_rate = 22050
     samples = int(sample_rate * duration)
 
-    # Filtered noise
-    noise = np.random.uniform(-1, 1, samples)
-
-    # Apply sharp envelope
-    envelope = np.exp(-10 * np.linspace(0, 1, samples))
+    # Short noise burst with a sharp envelope, in one fused pass
+    wave_data = _noise_burst(samples, decay=10, volume=volume)
 
-    wave_data = noise * envelope * volume
-    wave_data = (wave_data * 32767).astype(np.int16)
-
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(wave_data.tobytes())
-
-    print(f"✅ Generated: {filename}")
+    _write_wav(filename, wave_data, sample_rate)
 
 
 def main():
@@ -156,12 +164,19 @@ def main():
 
     print("\nGenerating sound effects...\n")
 
-    # Generate sounds
-    generate_beep('assets/sounds/bomb_place.wav', frequency=440, duration=0.1)
-    generate_explosion('assets/sounds/explosion.wav')
-    generate_powerup('assets/sounds/powerup.wav')
-    generate_death('assets/sounds/death.wav')
-    generate_wall_break('assets/sounds/wall_break.wav')
+    # Each sound is independent, so synthesize them in parallel
+    tasks = [
+        (generate_beep, ('assets/sounds/bomb_place.wav',), {'frequency': 440, 'duration': 0.1}),
+        (generate_explosion, ('assets/sounds/explosion.wav',), {}),
+        (generate_powerup, ('assets/sounds/powerup.wav',), {}),
+        (generate_death, ('assets/sounds/death.wav',), {}),
+        (generate_wall_break, ('assets/sounds/wall_break.wav',), {}),
+    ]
+
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(func, *args, **kwargs) for func, args, kwargs in tasks]
+        for future in futures:
+            future.result()
 
     print("\n✅ All sounds generated successfully!")
     print("\nSound files created in: assets/sounds/")
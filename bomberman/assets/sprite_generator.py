@@ -4,40 +4,80 @@ Generate beautiful sprites for the game using procedural graphics
 """
 
 import pygame
+import numpy as np
+import hashlib
 import math
 import os
+import json
+import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 
+# Atlas dimensions - 512x512 fits all 28 sprites comfortably
+ATLAS_SIZE = 512
 
-def create_gradient_circle(size, color1, color2):
-    """Create a circle with radial gradient"""
-    surface = pygame.Surface((size, size), pygame.SRCALPHA)
-    center = size // 2
+# Unit-circle vertices for the power-up stars, hoisted to module scope so
+# each sprite only scales them instead of re-running the trig loop
+_STAR_UNIT_8 = [(math.cos(i * math.pi / 4), math.sin(i * math.pi / 4))
+                for i in range(8)]
+_STAR_UNIT_8_INNER = [(math.cos(i * math.pi / 4 + math.pi / 8),
+                       math.sin(i * math.pi / 4 + math.pi / 8))
+                      for i in range(8)]
+
+
+@lru_cache(maxsize=8)
+def _font(size):
+    """Shared Font instances; constructing one per sprite re-parses the face"""
+    return pygame.font.Font(None, size)
+
+
+@lru_cache(maxsize=64)
+def _render_text(size, text, color):
+    """Memoized glyph rendering for repeated labels (P1/P2, icons, ...)"""
+    return _font(size).render(text, True, color)
+
+
+def _gradient_disk(size, inner_radius, outer_radius, inner_color, outer_color):
+    """
+    Build a radial-gradient disk in one vectorized NumPy pass.
 
-    for radius in range(center, 0, -1):
-        # Interpolate between colors
-        t = radius / center
-        r = int(color1[0] * t + color2[0] * (1 - t))
-        g = int(color1[1] * t + color2[1] * (1 - t))
-        b = int(color1[2] * t + color2[2] * (1 - t))
+    Pixels inside inner_radius take inner_color, pixels beyond outer_radius
+    are transparent, and the band between interpolates linearly. Replaces
+    the old per-radius pygame.draw.circle loops, which issued O(size) draw
+    calls and repainted the same pixels many times over.
+    """
+    center = size // 2
+    xx, yy = np.ogrid[:size, :size]
+    dist = np.hypot(xx - center, yy - center)
+    span = max(outer_radius - inner_radius, 1)
+    t = np.clip((dist - inner_radius) / span, 0.0, 1.0)[..., None]
 
-        pygame.draw.circle(surface, (r, g, b), (center, center), radius)
+    inner = np.asarray(inner_color, dtype=np.float32)
+    outer = np.asarray(outer_color, dtype=np.float32)
+    rgb = (inner * (1.0 - t) + outer * t).astype(np.uint8)
 
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pixels = pygame.surfarray.pixels3d(surface)
+    pixels[...] = rgb
+    alpha = pygame.surfarray.pixels_alpha(surface)
+    alpha[...] = (dist <= outer_radius) * np.uint8(255)
+    del pixels, alpha  # release surface locks
     return surface
 
 
+def create_gradient_circle(size, color1, color2):
+    """Create a circle with radial gradient"""
+    center = size // 2
+    return _gradient_disk(size, 0, center, color2, color1)
+
+
 def create_player_sprite(size, base_color, player_num):
     """Create an animated player sprite with face"""
-    surface = pygame.Surface((size, size), pygame.SRCALPHA)
     center = size // 2
 
-    # Body (gradient circle)
-    for radius in range(center - 2, center // 3, -1):
-        t = (radius - center // 3) / (center - 2 - center // 3)
-        # Darken towards center
-        r = int(base_color[0] * (0.7 + 0.3 * t))
-        g = int(base_color[1] * (0.7 + 0.3 * t))
-        b = int(base_color[2] * (0.7 + 0.3 * t))
-        pygame.draw.circle(surface, (r, g, b), (center, center), radius)
+    # Body (gradient circle, darker towards center)
+    inner_color = tuple(c * 0.7 for c in base_color)
+    surface = _gradient_disk(size, center // 3, center - 2, inner_color, base_color)
 
     # Outline
     pygame.draw.circle(surface, (0, 0, 0), (center, center), center - 2, 2)
@@ -62,8 +102,7 @@ def create_player_sprite(size, base_color, player_num):
     pygame.draw.arc(surface, (0, 0, 0), mouth_rect, 0, math.pi, 2)
 
     # Player number badge
-    font = pygame.font.Font(None, 16)
-    text = font.render(f"P{player_num}", True, (255, 255, 255))
+    text = _render_text(16, f"P{player_num}", (255, 255, 255))
     text_rect = text.get_rect(center=(center, size - 8))
 
     # Badge background
@@ -77,14 +116,10 @@ def create_player_sprite(size, base_color, player_num):
 
 def create_bomb_sprite(size):
     """Create an animated bomb sprite"""
-    surface = pygame.Surface((size, size), pygame.SRCALPHA)
     center = size // 2
 
     # Bomb body (black with gradient)
-    for radius in range(center - 2, center // 4, -1):
-        t = (radius - center // 4) / (center - 2 - center // 4)
-        brightness = int(80 * t)
-        pygame.draw.circle(surface, (brightness, brightness, brightness), (center, center), radius)
+    surface = _gradient_disk(size, center // 4, center - 2, (0, 0, 0), (80, 80, 80))
 
     # Highlight
     pygame.draw.circle(surface, (120, 120, 120), (center - 4, center - 4), 3)
@@ -119,31 +154,22 @@ def create_powerup_sprite(size, powerup_type):
 
     color1, color2 = colors.get(powerup_type, ((255, 255, 255), (200, 200, 200)))
 
-    # Rotating star background
-    star_points = []
-    for i in range(8):
-        angle = (i * math.pi / 4)
-        radius = (center - 2) if i % 2 == 0 else (center - 8)
-        x = center + int(radius * math.cos(angle))
-        y = center + int(radius * math.sin(angle))
-        star_points.append((x, y))
+    # Rotating star background (precomputed unit vertices, scaled per size)
+    star_points = [(center + int(((center - 2) if i % 2 == 0 else (center - 8)) * ux),
+                    center + int(((center - 2) if i % 2 == 0 else (center - 8)) * uy))
+                   for i, (ux, uy) in enumerate(_STAR_UNIT_8)]
 
     # Gradient fill
     pygame.draw.polygon(surface, color1, star_points)
 
     # Inner star
-    inner_points = []
-    for i in range(8):
-        angle = (i * math.pi / 4) + (math.pi / 8)
-        radius = (center - 6) if i % 2 == 0 else (center - 10)
-        x = center + int(radius * math.cos(angle))
-        y = center + int(radius * math.sin(angle))
-        inner_points.append((x, y))
+    inner_points = [(center + int(((center - 6) if i % 2 == 0 else (center - 10)) * ux),
+                     center + int(((center - 6) if i % 2 == 0 else (center - 10)) * uy))
+                    for i, (ux, uy) in enumerate(_STAR_UNIT_8_INNER)]
 
     pygame.draw.polygon(surface, color2, inner_points)
 
     # Icon
-    font = pygame.font.Font(None, 20)
     icons = {
         'bomb_count': 'B',
         'bomb_power': 'P',
@@ -153,11 +179,11 @@ def create_powerup_sprite(size, powerup_type):
     }
 
     icon = icons.get(powerup_type, '?')
-    text = font.render(icon, True, (255, 255, 255))
+    text = _render_text(20, icon, (255, 255, 255))
     text_rect = text.get_rect(center=(center, center))
 
     # Shadow
-    shadow = font.render(icon, True, (0, 0, 0))
+    shadow = _render_text(20, icon, (0, 0, 0))
     surface.blit(shadow, (text_rect.x + 1, text_rect.y + 1))
     surface.blit(text, text_rect)
 
@@ -166,7 +192,6 @@ def create_powerup_sprite(size, powerup_type):
 
 def create_enemy_sprite(size, enemy_type):
     """Create enemy sprites with different looks"""
-    surface = pygame.Surface((size, size), pygame.SRCALPHA)
     center = size // 2
 
     # Color and style based on type
@@ -181,12 +206,8 @@ def create_enemy_sprite(size, enemy_type):
         eye_color = (255, 0, 0)
 
     # Body (darker gradient)
-    for radius in range(center - 2, center // 3, -1):
-        t = (radius - center // 3) / (center - 2 - center // 3)
-        r = int(base_color[0] * (0.5 + 0.5 * t))
-        g = int(base_color[1] * (0.5 + 0.5 * t))
-        b = int(base_color[2] * (0.5 + 0.5 * t))
-        pygame.draw.circle(surface, (r, g, b), (center, center), radius)
+    inner_color = tuple(c * 0.5 for c in base_color)
+    surface = _gradient_disk(size, center // 3, center - 2, inner_color, base_color)
 
     # Spiky outline
     pygame.draw.circle(surface, (0, 0, 0), (center, center), center - 2, 2)
@@ -208,9 +229,8 @@ def create_enemy_sprite(size, enemy_type):
     pygame.draw.lines(surface, (0, 0, 0), False, mouth_points, 2)
 
     # Type indicator
-    font = pygame.font.Font(None, 14)
     type_chars = {'static': 'S', 'chasing': 'C', 'intelligent': 'A*'}
-    text = font.render(type_chars.get(enemy_type, '?'), True, (255, 255, 255))
+    text = _render_text(14, type_chars.get(enemy_type, '?'), (255, 255, 255))
     text_rect = text.get_rect(center=(center, size - 6))
     surface.blit(text, text_rect)
 
@@ -274,41 +294,173 @@ def create_wall_sprite(size, wall_type, theme='desert'):
     return surface
 
 
-def create_explosion_frame(size, frame, total_frames):
-    """Create explosion animation frame"""
-    surface = pygame.Surface((size, size), pygame.SRCALPHA)
-    center = size // 2
-
-    # Animation progress (0 to 1)
+def _explosion_frame_params(frame, total_frames):
+    """Compute (progress, color) for an explosion animation frame"""
     progress = frame / total_frames
 
-    # Expanding radius
-    max_radius = center
-    radius = int(max_radius * progress)
-
     # Colors fade from yellow to red to transparent
     if progress < 0.3:
         color = (255, 255, 0, 255)  # Yellow
     elif progress < 0.6:
         t = (progress - 0.3) / 0.3
-        r = 255
-        g = int(255 * (1 - t))
-        b = 0
-        color = (r, g, b, 255)  # Yellow to red
+        color = (255, int(255 * (1 - t)), 0, 255)  # Yellow to red
     else:
         t = (progress - 0.6) / 0.4
-        alpha = int(255 * (1 - t))
-        color = (255, 0, 0, alpha)  # Fading red
+        color = (255, 0, 0, int(255 * (1 - t)))  # Fading red
+
+    return progress, color
+
+
+# The animation always runs 8 frames; precompute the per-frame parameters
+# once so repeated generation is two table lookups and two circle draws
+_EXPLOSION_LUT = tuple(_explosion_frame_params(i, 8) for i in range(8))
+
 
-    # Draw expanding circle
-    pygame.draw.circle(surface, color, (center, center), radius)
+@lru_cache(maxsize=4)
+def _dist_field(size):
+    """Distance of every pixel from the sprite center, computed once per size"""
+    yy, xx = np.ogrid[:size, :size]
+    return np.hypot(xx - size // 2, yy - size // 2)
+
+
+def create_explosion_frame(size, frame, total_frames):
+    """Create explosion animation frame"""
+    center = size // 2
+
+    if total_frames == 8:
+        progress, color = _EXPLOSION_LUT[frame]
+    else:
+        progress, color = _explosion_frame_params(frame, total_frames)
+
+    # Write the whole RGBA frame with two masked assignments against the
+    # shared distance field instead of per-pixel circle rasterization
+    dist = _dist_field(size)
+    rgba = np.zeros((size, size, 4), dtype=np.uint8)
+    rgba[dist <= int(center * progress)] = color
 
     # Inner bright core
     if progress < 0.5:
-        core_radius = max(2, int(radius * 0.3))
-        pygame.draw.circle(surface, (255, 255, 255), (center, center), core_radius)
+        core_radius = max(2, int(center * progress * 0.3))
+        rgba[dist <= core_radius] = (255, 255, 255, 255)
+
+    return pygame.image.frombytes(rgba.tobytes(), (size, size), 'RGBA')
 
-    return surface
+
+def generate_all_sprites():
+    """
+    Generate every game sprite keyed by asset name.
+
+    Returns:
+        dict: {name: pygame.Surface} for all players, bombs, power-ups,
+              enemies, walls and explosion frames
+    """
+    sprites = {
+        'player1': create_player_sprite(40, (255, 0, 0), 1),
+        'player2': create_player_sprite(40, (0, 0, 255), 2),
+        'bomb': create_bomb_sprite(40),
+    }
+
+    for ptype in ['bomb_count', 'bomb_power', 'speed_boost', 'skateboard', 'wall_pass']:
+        sprites[f'powerup_{ptype}'] = create_powerup_sprite(30, ptype)
+
+    for etype in ['static', 'chasing', 'intelligent']:
+        sprites[f'enemy_{etype}'] = create_enemy_sprite(40, etype)
+
+    for theme in ['desert', 'forest', 'city']:
+        for wtype in ['unbreakable', 'breakable', 'hard']:
+            sprites[f'wall_{theme}_{wtype}'] = create_wall_sprite(40, wtype, theme)
+
+    for frame in range(8):
+        sprites[f'explosion_{frame}'] = create_explosion_frame(40, frame, 8)
+
+    return sprites
+
+
+def atlas():
+    """
+    Pack all sprites into a single texture atlas.
+
+    Uses a simple shelf packer: sprites are sorted by descending height
+    and placed left-to-right, opening a new row when the current one is full.
+    Loading one atlas instead of ~30 PNGs cuts file I/O and decode work,
+    and subsurface views into it share the same pixel buffer.
+
+    Returns:
+        tuple: (atlas Surface, {name: pygame.Rect} placement map)
+    """
+    sprites = generate_all_sprites()
+    surface = pygame.Surface((ATLAS_SIZE, ATLAS_SIZE), pygame.SRCALPHA)
+    rects = {}
+
+    x = y = row_height = 0
+    for name, sprite in sorted(sprites.items(), key=lambda item: -item[1].get_height()):
+        w, h = sprite.get_size()
+        if x + w > ATLAS_SIZE:
+            # Start a new shelf row
+            x = 0
+            y += row_height
+            row_height = 0
+        surface.blit(sprite, (x, y))
+        rects[name] = pygame.Rect(x, y, w, h)
+        x += w
+        row_height = max(row_height, h)
+
+    return surface, rects
+
+
+def save_atlas(image_path='assets/images/atlas.png', manifest_path='assets/images/atlas.json'):
+    """Generate and save the texture atlas plus its JSON placement manifest"""
+    surface, rects = atlas()
+    pygame.image.save(surface, image_path)
+    with open(manifest_path, 'w') as manifest_file:
+        json.dump({name: [r.x, r.y, r.width, r.height] for name, r in rects.items()},
+                  manifest_file, indent=2)
+    return surface, rects
+
+
+def _sprite_tasks():
+    """List of (creator function name, args, output path) for every sprite"""
+    tasks = [
+        ('create_player_sprite', (40, (255, 0, 0), 1), 'assets/images/players/player1.png'),
+        ('create_player_sprite', (40, (0, 0, 255), 2), 'assets/images/players/player2.png'),
+        ('create_bomb_sprite', (40,), 'assets/images/bombs/bomb.png'),
+    ]
+
+    for ptype in ['bomb_count', 'bomb_power', 'speed_boost', 'skateboard', 'wall_pass']:
+        tasks.append(('create_powerup_sprite', (30, ptype), f'assets/images/powerups/{ptype}.png'))
+
+    for etype in ['static', 'chasing', 'intelligent']:
+        tasks.append(('create_enemy_sprite', (40, etype), f'assets/images/enemies/{etype}.png'))
+
+    for theme in ['desert', 'forest', 'city']:
+        for wtype in ['unbreakable', 'breakable', 'hard']:
+            tasks.append(('create_wall_sprite', (40, wtype, theme),
+                          f'assets/images/walls/{theme}_{wtype}.png'))
+
+    for frame in range(8):
+        tasks.append(('create_explosion_frame', (40, frame, 8),
+                      f'assets/images/explosions/explosion_{frame}.png'))
+
+    return tasks
+
+
+def _render_sprite(task):
+    """
+    Render one sprite and return its raw pixels.
+
+    Runs in a pool worker process, so pygame must be (re-)initialized here.
+    Encoding happens in the parent, where identical frames can be shared.
+    """
+    func_name, args, path = task
+    pygame.init()
+    surface = globals()[func_name](*args)
+    return path, surface.get_size(), pygame.image.tobytes(surface, 'RGBA')
+
+
+def _encode_png(path, size, pixels):
+    """Encode one raw RGBA buffer to PNG (libpng releases the GIL)"""
+    pygame.image.save(pygame.image.frombytes(pixels, size, 'RGBA'), path)
+    print(f"  ✅ {os.path.basename(path)}")
 
 
 def main():
@@ -329,43 +481,37 @@ def main():
 
     print("Generating sprites...\n")
 
-    # Players
-    print("📦 Players:")
-    pygame.image.save(create_player_sprite(40, (255, 0, 0), 1), 'assets/images/players/player1.png')
-    print("  ✅ player1.png")
-    pygame.image.save(create_player_sprite(40, (0, 0, 255), 2), 'assets/images/players/player2.png')
-    print("  ✅ player2.png")
-
-    # Bomb
-    print("\n💣 Bombs:")
-    pygame.image.save(create_bomb_sprite(40), 'assets/images/bombs/bomb.png')
-    print("  ✅ bomb.png")
-
-    # Power-ups
-    print("\n⭐ Power-ups:")
-    for ptype in ['bomb_count', 'bomb_power', 'speed_boost', 'skateboard', 'wall_pass']:
-        pygame.image.save(create_powerup_sprite(30, ptype), f'assets/images/powerups/{ptype}.png')
-        print(f"  ✅ {ptype}.png")
-
-    # Enemies
-    print("\n👾 Enemies:")
-    for etype in ['static', 'chasing', 'intelligent']:
-        pygame.image.save(create_enemy_sprite(40, etype), f'assets/images/enemies/{etype}.png')
-        print(f"  ✅ {etype}.png")
-
-    # Walls
-    print("\n🧱 Walls:")
-    for theme in ['desert', 'forest', 'city']:
-        for wtype in ['unbreakable', 'breakable', 'hard']:
-            filename = f'assets/images/walls/{theme}_{wtype}.png'
-            pygame.image.save(create_wall_sprite(40, wtype, theme), filename)
-            print(f"  ✅ {theme}_{wtype}.png")
-
-    # Explosion frames
-    print("\n💥 Explosions:")
-    for frame in range(8):
-        pygame.image.save(create_explosion_frame(40, frame, 8), f'assets/images/explosions/explosion_{frame}.png')
-        print(f"  ✅ explosion_{frame}.png")
+    # Each sprite is independent, so fan the rendering out over all cores
+    with ProcessPoolExecutor() as executor:
+        rendered = list(executor.map(_render_sprite, _sprite_tasks()))
+
+    # Encode each unique pixel buffer once, on a thread pool; sprites with
+    # identical pixels (hashed with blake2b) become hard links instead of
+    # paying a second libpng encode
+    first_path = {}
+    duplicates = []
+    with ThreadPoolExecutor() as encoder:
+        for path, size, pixels in rendered:
+            digest = hashlib.blake2b(pixels).digest()
+            original = first_path.setdefault(digest, path)
+            if original is path:
+                encoder.submit(_encode_png, path, size, pixels)
+            else:
+                duplicates.append((original, path))
+
+    for original, path in duplicates:
+        if os.path.exists(path):
+            os.remove(path)
+        try:
+            os.link(original, path)
+        except OSError:
+            shutil.copyfile(original, path)
+        print(f"  🔗 {os.path.basename(path)} -> {os.path.basename(original)}")
+
+    # Texture atlas (all sprites in one image)
+    print("\n🗺️  Atlas:")
+    save_atlas()
+    print("  ✅ atlas.png + atlas.json")
 
     print("\n" + "=" * 60)
     print("✅ All sprites generated successfully!")
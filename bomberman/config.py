@@ -1,5 +1,6 @@
 # config.py - Game Configuration Settings
 import os
+from enum import IntEnum
 
 # Screen Settings
 SCREEN_WIDTH = 800
@@ -38,25 +39,30 @@ SERVER_HOST = os.getenv('SERVER_HOST', '192.168.208.1')  # Listen on all interfa
 SERVER_PORT = int(os.getenv('SERVER_PORT', 5000))
 
 # Theme Settings
+class Theme(IntEnum):
+    """Theme indices into THEME_COLORS"""
+    DESERT = 0
+    FOREST = 1
+    CITY = 2
+
+
+# Color tables indexed by Theme; inner order follows WALL_COLOR_INDEX.
+# Tuple indexing replaces two dict lookups on the wall drawing path.
+WALL_COLOR_INDEX = {'bg': 0, 'breakable': 1, 'unbreakable': 2, 'hard': 3}
+
+THEME_COLORS = (
+    ((194, 178, 128), (160, 82, 45), (139, 69, 19), (205, 133, 63)),     # desert
+    ((34, 139, 34), (0, 100, 0), (47, 79, 47), (85, 107, 47)),           # forest
+    ((128, 128, 128), (169, 169, 169), (105, 105, 105), (112, 128, 144)) # city
+)
+
+# Legacy name-keyed view kept for callers that look themes up by string
 THEMES = {
-    'desert': {
-        'bg_color': (194, 178, 128),
-        'breakable_color': (160, 82, 45),
-        'unbreakable_color': (139, 69, 19),
-        'hard_color': (205, 133, 63)
-    },
-    'forest': {
-        'bg_color': (34, 139, 34),
-        'breakable_color': (0, 100, 0),
-        'unbreakable_color': (47, 79, 47),
-        'hard_color': (85, 107, 47)
-    },
-    'city': {
-        'bg_color': (128, 128, 128),
-        'breakable_color': (169, 169, 169),
-        'unbreakable_color': (105, 105, 105),
-        'hard_color': (112, 128, 144)
+    theme.name.lower(): {
+        f'{key}_color': THEME_COLORS[theme][index]
+        for key, index in WALL_COLOR_INDEX.items()
     }
+    for theme in Theme
 }
 
 # PowerUp Settings
@@ -4,23 +4,103 @@ MVC Pattern - Game Controller
 Controls game logic and coordinates between Model and View
 """
 
+import itertools
 import pygame
 import random
+import numpy as np
 from patterns.creational.factory import WallFactory, PowerUpFactory
 from patterns.behavioral.strategy import create_ai_strategy
-from patterns.behavioral.observer import GameEventManager, GameEvent, ScoreObserver, StatisticsObserver
+from patterns.behavioral.observer import GameEventManager, GameEvent, Observer, ScoreObserver, StatisticsObserver
 from models.player import Player
 from models.enemy import Enemy
 from models.bomb import Bomb, Explosion
 from config import *
 
 
+# Blast ray directions as one interned constant; built once instead of
+# re-allocating direction lists per explosion
+_DIRECTIONS = ((0, -1, 'up'), (0, 1, 'down'), (-1, 0, 'left'), (1, 0, 'right'))
+
+# Monotonic token identifying each generated map; the view keys its
+# pre-baked background layer on this, which — unlike the id() of a wall
+# list — can never be recycled across games
+_map_tokens = itertools.count(1)
+
+
+def propagate(mask, bx, by, power):
+    """
+    Trace a bomb's four explosion rays over the uint8 block mask.
+
+    Pure grid arithmetic with no game objects, so the whole propagation
+    could be handed to a JIT compiler wholesale; callers turn the returned
+    tiles into explosions, damage checks and wall events.
+
+    Args:
+        mask (np.ndarray): (GRID_HEIGHT, GRID_WIDTH) blocker mask
+        bx (int): Bomb grid X
+        by (int): Bomb grid Y
+        power (int): Explosion range in tiles
+
+    Returns:
+        list: (x, y, direction, hit_blocker) tuples in ray order
+    """
+    tiles = []
+    for dx, dy, dir_name in _DIRECTIONS:
+        if dy < 0:
+            ray = mask[max(by - power, 0):by, bx][::-1]
+        elif dy > 0:
+            ray = mask[by + 1:by + 1 + power, bx]
+        elif dx < 0:
+            ray = mask[by, max(bx - power, 0):bx][::-1]
+        else:
+            ray = mask[by, bx + 1:bx + 1 + power]
+
+        blocked = int(np.argmax(ray > 0)) if ray.any() else len(ray)
+
+        for i in range(1, blocked + 1):
+            tiles.append((bx + dx * i, by + dy * i, dir_name, False))
+
+        if blocked < len(ray):
+            tiles.append((bx + dx * (blocked + 1), by + dy * (blocked + 1),
+                          dir_name, True))
+
+    return tiles
+
+
+class _GameOverWatcher(Observer):
+    """
+    Observer that flags the controller for a game-over re-check.
+    Game over can only change when something dies, so the controller
+    subscribes this watcher to the death events instead of re-checking
+    every frame.
+    """
+
+    def __init__(self, controller):
+        self.controller = controller
+
+    def update(self, event, data):
+        """Mark the controller dirty on PLAYER_DIED / ENEMY_DIED"""
+        self.controller._dirty_gameover = True
+
+
 class GameController:
     """
     Main game controller following MVC pattern.
     Manages game state, logic, and coordinates between models and views.
     """
 
+    # Permanently blocked tiles (border walls + the even-index pillar
+    # pattern) as a flat bytes mask. These never change during a game, so
+    # one byte probe settles most blocked-ray checks without touching the
+    # wall objects at all.
+    _STATIC_BLOCK = bytes(
+        1 if (x == 0 or y == 0 or x == GRID_WIDTH - 1 or y == GRID_HEIGHT - 1
+              or (x % 2 == 0 and y % 2 == 0
+                  and 2 <= x <= GRID_WIDTH - 3 and 2 <= y <= GRID_HEIGHT - 3))
+        else 0
+        for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH)
+    )
+
     def __init__(self, player1_name="Player1", player2_name="Player2", theme='desert', is_multiplayer=False):
         """
         Initialize game controller.
@@ -32,6 +112,9 @@ class GameController:
             is_multiplayer (bool): True for online multiplayer
         """
         # Game state
+        # Per-instance RNG: skips the module-level generator's shared state
+        # when update() rolls many chances per frame
+        self._rng = random.Random()
         self.running = False
         self.paused = False
         self.game_over = False
@@ -51,13 +134,47 @@ class GameController:
         from patterns.behavioral.observer import SoundObserver
         self.sound_observer = SoundObserver()
 
-        self.event_manager.attach(self.score_observer)
-        self.event_manager.attach(self.stats_observer)
-        self.event_manager.attach(self.sound_observer)
+        # Register each observer only for the events it actually handles,
+        # so trigger_event skips the ones that would ignore the dispatch
+        self.event_manager.attach(self.score_observer, (
+            GameEvent.WALL_DESTROYED, GameEvent.ENEMY_DIED,
+            GameEvent.POWERUP_COLLECTED))
+        self.event_manager.attach(self.stats_observer, (
+            GameEvent.BOMB_PLACED, GameEvent.WALL_DESTROYED,
+            GameEvent.POWERUP_COLLECTED, GameEvent.ENEMY_DIED,
+            GameEvent.PLAYER_DIED))
+        self.event_manager.attach(self.sound_observer, (
+            GameEvent.BOMB_PLACED, GameEvent.BOMB_EXPLODED,
+            GameEvent.POWERUP_COLLECTED, GameEvent.PLAYER_DIED,
+            GameEvent.WALL_DESTROYED))
+
+        # Re-check game over only after a death event, not every frame
+        self._dirty_gameover = False
+        self._gameover_watcher = _GameOverWatcher(self)
+        self.event_manager.attach(self._gameover_watcher, (
+            GameEvent.PLAYER_DIED, GameEvent.ENEMY_DIED))
 
         # Game objects
+        self.map_token = next(_map_tokens)
         self.walls = []
+        # Grid index over live walls: _wall_grid[y][x] is the wall occupying
+        # that tile (or None), so explosion rays and map placement check a
+        # tile in O(1) instead of scanning the wall list
+        self._wall_grid = [[None] * GRID_WIDTH for _ in range(GRID_HEIGHT)]
+        # Blocker mask mirroring the grid (0 empty, 1 destructible, 2
+        # permanent); explosion rays scan it with vectorized slices
+        self._block_mask = np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
         self.players = []
+        # All living entities (players + enemies) by cell, for explosion damage
+        self._entity_grid = {}
+        # Events buffered during a tick and dispatched once, deduplicated
+        self._pending_events = []
+        # Recycled bomb/explosion instances; a blast reuses these instead of
+        # allocating up to 1 + 4*power fresh objects mid-frame
+        self._bomb_pool = []
+        self._explosion_pool = []
+        # Long-lived render-state dict mutated in place by get_game_state()
+        self._state_dict = {'is_single_player': self.is_single_player}
         self.enemies = []
         self.bombs = []
         self.explosions = []
@@ -80,6 +197,22 @@ class GameController:
             'bomb': pygame.K_RETURN
         }
 
+        # Flat key -> (player_id, action) dispatch table so the input pump
+        # resolves a keystroke with one dict probe instead of scanning both
+        # per-player control dicts
+        self.key_actions = {}
+        for player_id, controls in ((1, self.player1_controls),
+                                    (2, self.player2_controls)):
+            for action, key in controls.items():
+                self.key_actions[key] = (player_id, action)
+
+        # Movement scancodes as flat (left, right, up, down) tuples so the
+        # per-frame keyboard poll indexes them without dict lookups
+        self.player1_keys = tuple(self.player1_controls[d]
+                                  for d in ('left', 'right', 'up', 'down'))
+        self.player2_keys = tuple(self.player2_controls[d]
+                                  for d in ('left', 'right', 'up', 'down'))
+
         # Initialize game
         self._initialize_game(player1_name, player2_name)
 
@@ -112,43 +245,48 @@ class GameController:
         self.running = True
         print(f"   ✓ Game initialized!\n")
 
+    def _add_wall(self, wall_type, x, y):
+        """Create a wall and register it in both the list and the grid index"""
+        wall = WallFactory.create_wall(wall_type, x, y, self.theme)
+        self.walls.append(wall)
+        self._wall_grid[y][x] = wall
+        self._block_mask[y, x] = 2 if wall_type == 'unbreakable' else 1
+        return wall
+
     def _create_map(self):
         """Create game map with walls"""
         # Border walls (unbreakable)
         for x in range(GRID_WIDTH):
-            self.walls.append(WallFactory.create_wall('unbreakable', x, 0, self.theme))
-            self.walls.append(WallFactory.create_wall('unbreakable', x, GRID_HEIGHT - 1, self.theme))
+            self._add_wall('unbreakable', x, 0)
+            self._add_wall('unbreakable', x, GRID_HEIGHT - 1)
 
         for y in range(1, GRID_HEIGHT - 1):
-            self.walls.append(WallFactory.create_wall('unbreakable', 0, y, self.theme))
-            self.walls.append(WallFactory.create_wall('unbreakable', GRID_WIDTH - 1, y, self.theme))
+            self._add_wall('unbreakable', 0, y)
+            self._add_wall('unbreakable', GRID_WIDTH - 1, y)
 
         # Internal unbreakable walls (grid pattern)
         for x in range(2, GRID_WIDTH - 2, 2):
             for y in range(2, GRID_HEIGHT - 2, 2):
-                self.walls.append(WallFactory.create_wall('unbreakable', x, y, self.theme))
-
-        # Random breakable and hard walls
-        safe_positions = [(1, 1), (1, 2), (2, 1),
-                          (GRID_WIDTH - 2, GRID_HEIGHT - 2),
-                          (GRID_WIDTH - 2, GRID_HEIGHT - 3),
-                          (GRID_WIDTH - 3, GRID_HEIGHT - 2)]
-
-        for _ in range(30):
-            x = random.randint(1, GRID_WIDTH - 2)
-            y = random.randint(1, GRID_HEIGHT - 2)
-
-            if (x, y) not in safe_positions:
-                # Check if position is already occupied
-                occupied = False
-                for wall in self.walls:
-                    if wall.grid_x == x and wall.grid_y == y:
-                        occupied = True
-                        break
-
-                if not occupied:
-                    wall_type = random.choice(['breakable', 'breakable', 'hard'])
-                    self.walls.append(WallFactory.create_wall(wall_type, x, y, self.theme))
+                self._add_wall('unbreakable', x, y)
+
+        # Random breakable and hard walls (frozenset: O(1) membership below)
+        safe_positions = frozenset({(1, 1), (1, 2), (2, 1),
+                                    (GRID_WIDTH - 2, GRID_HEIGHT - 2),
+                                    (GRID_WIDTH - 2, GRID_HEIGHT - 3),
+                                    (GRID_WIDTH - 3, GRID_HEIGHT - 2)})
+
+        # Sample free tiles without replacement: shuffle the candidate set
+        # once and take the first 30, instead of 30 rejection-tested rolls
+        candidates = [(x, y)
+                      for y in range(1, GRID_HEIGHT - 1)
+                      for x in range(1, GRID_WIDTH - 1)
+                      if (x, y) not in safe_positions and self._wall_grid[y][x] is None]
+        self._rng.shuffle(candidates)
+        chosen = candidates[:30]
+        wall_types = self._rng.choices(['breakable', 'hard'], weights=(2, 1), k=len(chosen))
+
+        for (x, y), wall_type in zip(chosen, wall_types):
+            self._add_wall(wall_type, x, y)
 
         # Add initial power-ups at specific strategic locations
         initial_powerup_positions = [
@@ -161,12 +299,7 @@ class GameController:
         
         for x, y, ptype in initial_powerup_positions:
             # Check if position is safe (no walls)
-            occupied = False
-            for wall in self.walls:
-                if wall.grid_x == x and wall.grid_y == y:
-                    occupied = True
-                    break
-            if not occupied:
+            if self._wall_grid[y][x] is None:
                 powerup = PowerUpFactory.create_powerup(ptype, x, y)
                 self.powerups.append(powerup)
 
@@ -182,9 +315,14 @@ class GameController:
 
         ai_types = ['static', 'chasing', 'intelligent']
         colors = [(128, 0, 128), (255, 0, 255), (255, 165, 0)]
+        # Cheaper strategies re-plan less often; smarter ones stay responsive
+        ai_periods = {'static': 200, 'chasing': 100, 'intelligent': 50}
 
         for i, (pos, ai_type, color) in enumerate(zip(enemy_positions, ai_types, colors)):
             enemy = Enemy(i + 1, pos[0], pos[1], color, create_ai_strategy(ai_type))
+            enemy.ai_period_ms = ai_periods[ai_type]
+            # Stagger first plans so the enemies don't all think in one frame
+            enemy._ai_accum = enemy.ai_period_ms * i // len(enemy_positions)
             self.enemies.append(enemy)
 
         print(f"   ✓ Created {len(self.enemies)} enemies")
@@ -199,54 +337,86 @@ class GameController:
         if not self.running or self.paused or self.game_over:
             return
 
-        # Update players
+        # Update players and hoist the is_alive() query to once per player
+        # per frame
+        alive_players = []
         for player in self.players:
-            if hasattr(player, 'state_manager'):
-                player.state_manager.update(dt)
-
-        # Update enemies
-        for enemy in self.enemies[:]:
-            enemy.update(dt, self.walls, self.players, self.enemies)
-
-            # Check collision with players
-            for player in self.players:
-                if enemy.alive and player.state_manager.is_alive() and enemy.rect.colliderect(player.rect):
-                    player.die()
-                    self.event_manager.trigger_event(GameEvent.PLAYER_DIED,
-                                                     {'player': player.player_id})
-            
-            # Remove dead enemies from list
-            if not enemy.alive:
-                self.enemies.remove(enemy)
-
-        # Update bombs
-        for bomb in self.bombs[:]:
-            if bomb.update(dt):
-                self._handle_bomb_explosion(bomb)
-                self.bombs.remove(bomb)
-                bomb.owner.bomb_exploded()
-
-        # Update explosions
-        for explosion in self.explosions[:]:
-            if explosion.update(dt):
-                self.explosions.remove(explosion)
+            # Player.__init__ always assigns state_manager, so no hasattr guard
+            player.state_manager.update(dt)
+            if player.state_manager.alive:
+                alive_players.append(player)
+
+        # Update enemies: per-enemy AI planning, then one batched movement
+        # pass whose collision arithmetic is vectorized over the block mask
+        for enemy in self.enemies:
+            enemy.plan(dt, self.walls, self.players, self.enemies)
+        Enemy.move_batch(self.enemies, self._block_mask)
+
+        # Single-pass rebuild; no O(N) remove mid-iteration
+        surviving_enemies = []
+        enemy_rects = []
+        for enemy in self.enemies:
+            if enemy.alive:
+                surviving_enemies.append(enemy)
+                enemy_rects.append(enemy.rect)
+        self.enemies = surviving_enemies
+
+        # Enemy-vs-player collision: one C-side collidelistall call per
+        # player instead of a Python colliderect loop over the enemies
+        for player in alive_players:
+            if player.rect.collidelistall(enemy_rects):
+                player.die()
+                self._queue_event(GameEvent.PLAYER_DIED,
+                                  {'player': player.player_id})
+        alive_players = [p for p in alive_players if p.state_manager.alive]
+
+        # Position index over everything explosions can hurt, rebuilt after
+        # enemies have moved; each blast tile then costs one dict probe
+        entity_grid = {}
+        for player in alive_players:
+            entity_grid.setdefault((player.grid_x, player.grid_y), []).append(player)
+        for enemy in self.enemies:
+            if enemy.alive:
+                entity_grid.setdefault((enemy.grid_x, enemy.grid_y), []).append(enemy)
+        self._entity_grid = entity_grid
+
+        # Update bombs in one batched pass, then detonate the expired ones
+        self.bombs, exploded_bombs = Bomb.update_batch(self.bombs, dt)
+        for bomb in exploded_bombs:
+            self._handle_bomb_explosion(bomb)
+            bomb.owner.bomb_exploded()
+            self._bomb_pool.append(bomb)
+
+        # Update explosions, recycling finished ones into the pool
+        self.explosions, finished = Explosion.update_batch(self.explosions, dt)
+        self._explosion_pool.extend(finished)
 
         # Update powerups
-        for powerup in self.powerups[:]:
+        powerup_rects = []
+        for powerup in self.powerups:
             powerup.update(dt)
+            powerup_rects.append(powerup.rect)
 
-            # Check collision with players
-            for player in self.players:
-                if player.state_manager.is_alive() and player.rect.colliderect(powerup.rect) and not powerup.collected:
+        # Pickup check: one collidelistall per player over all power-up rects
+        for player in alive_players:
+            for i in player.rect.collidelistall(powerup_rects):
+                powerup = self.powerups[i]
+                if not powerup.collected:
                     powerup.collected = True
                     powerup.apply(player)
-                    self.powerups.remove(powerup)
-                    self.event_manager.trigger_event(GameEvent.POWERUP_COLLECTED,
-                                                     {'type': powerup.name,
-                                                      'player': player.player_id})
+                    self._queue_event(GameEvent.POWERUP_COLLECTED,
+                                      {'type': powerup.name,
+                                       'player': player.player_id})
+        if powerup_rects:
+            self.powerups = [p for p in self.powerups if not p.collected]
+
+        # Dispatch this tick's buffered events in one compacted pass
+        self._flush_events()
 
-        # Check game over
-        self._check_game_over()
+        # Check game over only when a death event flagged it this tick
+        if self._dirty_gameover:
+            self._dirty_gameover = False
+            self._check_game_over()
 
     def handle_input(self, player_id, dx, dy, place_bomb=False):
         """
@@ -268,85 +438,115 @@ class GameController:
 
         # Movement
         if dx != 0 or dy != 0:
-            player.move(dx, dy, self.walls)
+            player.move(dx, dy, self.walls, self._block_mask)
 
         # Place bomb
         if place_bomb and player.can_place_bomb():
-            bomb = Bomb(player.grid_x, player.grid_y, player.bomb_power, player)
-            self.bombs.append(bomb)
+            self._spawn_bomb(player.grid_x, player.grid_y, player.bomb_power, player)
             player.place_bomb()
             self.event_manager.trigger_event(GameEvent.BOMB_PLACED,
                                              {'player': player.player_id,
                                               'position': (player.grid_x, player.grid_y)})
 
-    def _handle_bomb_explosion(self, bomb):
-        """Handle bomb explosion effects"""
-        self.event_manager.trigger_event(GameEvent.BOMB_EXPLODED,
-                                         {'position': (bomb.grid_x, bomb.grid_y),
-                                          'power': bomb.power})
-
-        # Center explosion
-        self.explosions.append(Explosion(bomb.grid_x, bomb.grid_y, None))
-        self._check_explosion_damage(bomb.grid_x, bomb.grid_y)
-
-        # Directional explosions
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-        direction_names = ['up', 'down', 'left', 'right']
-
-        for (dx, dy), dir_name in zip(directions, direction_names):
-            for i in range(1, bomb.power + 1):
-                check_x = bomb.grid_x + (dx * i)
-                check_y = bomb.grid_y + (dy * i)
+    def _spawn_explosion(self, x, y, direction=None):
+        """Append an explosion at (x, y), recycling a pooled instance if any"""
+        if self._explosion_pool:
+            explosion = self._explosion_pool.pop()
+            explosion.reset(x, y, direction)
+        else:
+            explosion = Explosion(x, y, direction)
+        self.explosions.append(explosion)
+
+    def _spawn_bomb(self, x, y, power, owner):
+        """Create (or recycle) a bomb and add it to the active list"""
+        if self._bomb_pool:
+            bomb = self._bomb_pool.pop()
+            bomb.reset(x, y, power, owner)
+        else:
+            bomb = Bomb(x, y, power, owner)
+        self.bombs.append(bomb)
+        return bomb
 
-                # Check boundaries
-                if check_x < 0 or check_x >= GRID_WIDTH or check_y < 0 or check_y >= GRID_HEIGHT:
-                    break
+    def _queue_event(self, event_type, data):
+        """Buffer an event for one deduplicated dispatch at the end of update()"""
+        self._pending_events.append((event_type, data))
 
-                blocked = False
+    def _flush_events(self):
+        """
+        Dispatch buffered events in order, dropping same-tick duplicates.
 
-                # Check walls
-                for wall in self.walls:
-                    if wall.grid_x == check_x and wall.grid_y == check_y and not wall.destroyed:
-                        self.explosions.append(Explosion(check_x, check_y, dir_name))
+        Several bombs exploding in one tick can produce identical
+        (event, payload) pairs; compacting them here means every observer
+        sees each distinct event exactly once per tick.
+        """
+        if not self._pending_events:
+            return
 
-                        if wall.take_damage():
-                            self.event_manager.trigger_event(GameEvent.WALL_DESTROYED,
-                                                             {'type': wall.get_type(),
-                                                              'position': (check_x, check_y)})
+        seen = set()
+        for event_type, data in self._pending_events:
+            key = (event_type, tuple(sorted(data.items())))
+            if key not in seen:
+                seen.add(key)
+                self.event_manager.trigger_event(event_type, data)
+        self._pending_events.clear()
 
-                            # Spawn powerup
-                            if wall.get_type() == 'breakable' and random.random() < POWERUP_SPAWN_CHANCE:
-                                powerup_type = random.choice(POWERUP_TYPES)
-                                powerup = PowerUpFactory.create_powerup(powerup_type, check_x, check_y)
-                                self.powerups.append(powerup)
-                                self.event_manager.trigger_event(GameEvent.POWERUP_SPAWNED,
-                                                                 {'type': powerup_type,
-                                                                  'position': (check_x, check_y)})
+    def _handle_bomb_explosion(self, bomb):
+        """Handle bomb explosion effects"""
+        self._queue_event(GameEvent.BOMB_EXPLODED,
+                          {'position': (bomb.grid_x, bomb.grid_y),
+                           'power': bomb.power})
 
-                        blocked = True
-                        break
+        # Center explosion
+        self._spawn_explosion(bomb.grid_x, bomb.grid_y)
+        self._check_explosion_damage(bomb.grid_x, bomb.grid_y)
 
-                if blocked:
-                    break
+        # Directional explosions: propagate() resolves all four rays against
+        # the uint8 block mask (the borders live in the mask, so no bounds
+        # checks); this loop only turns its tiles into game effects
+        mask = self._block_mask
+        for check_x, check_y, dir_name, hit_blocker in propagate(
+                mask, bomb.grid_x, bomb.grid_y, bomb.power):
+            self._spawn_explosion(check_x, check_y, dir_name)
 
-                self.explosions.append(Explosion(check_x, check_y, dir_name))
+            if not hit_blocker:
                 self._check_explosion_damage(check_x, check_y)
+                continue
+
+            # The ray ended on a blocker: destructible walls take damage
+            if self._STATIC_BLOCK[check_y * GRID_WIDTH + check_x]:
+                continue
+
+            wall = self._wall_grid[check_y][check_x]
+            if wall is not None and wall.take_damage():
+                self._wall_grid[check_y][check_x] = None
+                mask[check_y, check_x] = 0
+                self._queue_event(GameEvent.WALL_DESTROYED,
+                                  {'type': wall.get_type(),
+                                   'position': (check_x, check_y)})
+
+                # Spawn powerup
+                if wall.get_type() == 'breakable' and self._rng.random() < POWERUP_SPAWN_CHANCE:
+                    powerup_type = self._rng.choice(POWERUP_TYPES)
+                    powerup = PowerUpFactory.create_powerup(powerup_type, check_x, check_y)
+                    self.powerups.append(powerup)
+                    self._queue_event(GameEvent.POWERUP_SPAWNED,
+                                      {'type': powerup_type,
+                                       'position': (check_x, check_y)})
 
     def _check_explosion_damage(self, x, y):
         """Check if explosion damages players or enemies"""
-        # Check players
-        for player in self.players:
-            if player.state_manager.is_alive() and player.grid_x == x and player.grid_y == y:
-                player.die()
-                self.event_manager.trigger_event(GameEvent.PLAYER_DIED,
-                                                 {'player': player.player_id})
-
-        # Check enemies
-        for enemy in self.enemies:
-            if enemy.alive and enemy.grid_x == x and enemy.grid_y == y:
-                enemy.die()
-                self.event_manager.trigger_event(GameEvent.ENEMY_DIED,
-                                                 {'enemy_id': enemy.enemy_id})
+        # One probe into the per-tick entity index instead of scanning both
+        # the player and enemy lists for every blast tile
+        for entity in self._entity_grid.get((x, y), ()):
+            if isinstance(entity, Enemy):
+                if entity.alive:
+                    entity.die()
+                    self._queue_event(GameEvent.ENEMY_DIED,
+                                      {'enemy_id': entity.enemy_id})
+            elif entity.state_manager.is_alive():
+                entity.die()
+                self._queue_event(GameEvent.PLAYER_DIED,
+                                  {'player': entity.player_id})
 
     def _check_game_over(self):
         """Check if game is over"""
@@ -387,6 +587,18 @@ class GameController:
                                              {'player': self.winner.player_id})
             print(f"🏆 Game Over: {self.winner.name} wins!")
 
+    def shutdown(self):
+        """
+        Detach this game's observers from the singleton event manager.
+
+        The manager outlives the controller, so without this every
+        finished game would stay reachable through its observers and
+        keep receiving death events from later games.
+        """
+        for observer in (self.score_observer, self.stats_observer,
+                         self.sound_observer, self._gameover_watcher):
+            self.event_manager.detach(observer)
+
     def pause(self):
         """Pause the game"""
         self.paused = True
@@ -397,17 +609,20 @@ class GameController:
 
     def get_game_state(self):
         """Get current game state for rendering"""
-        return {
-            'walls': self.walls,
-            'players': self.players,
-            'enemies': self.enemies,
-            'bombs': self.bombs,
-            'explosions': self.explosions,
-            'powerups': self.powerups,
-            'score': self.score_observer.score,
-            'stats': self.stats_observer.stats,
-            'game_over': self.game_over,
-            'winner': self.winner,
-            'is_single_player': self.is_single_player,
-            'winner_label': self.winner_label
-        }
\ No newline at end of file
+        # Mutate one long-lived dict instead of allocating 12 entries per
+        # frame; the entity lists are rebuilt each tick, so refresh those
+        # references too
+        state = self._state_dict
+        state['map_token'] = self.map_token
+        state['walls'] = self.walls
+        state['players'] = self.players
+        state['enemies'] = self.enemies
+        state['bombs'] = self.bombs
+        state['explosions'] = self.explosions
+        state['powerups'] = self.powerups
+        state['score'] = self.score_observer.score
+        state['stats'] = self.stats_observer.stats
+        state['game_over'] = self.game_over
+        state['winner'] = self.winner
+        state['winner_label'] = self.winner_label
+        return state
\ No newline at end of file
@@ -120,7 +120,8 @@ class NetworkGameController(GameController):
         if player_id != self.my_player_number:
             return
 
-        # Call parent method
+        # Call parent method, noting whether it actually placed a bomb
+        bombs_before = len(self.bombs)
         super().handle_input(player_id, dx, dy, place_bomb)
 
         # Send to network
@@ -133,13 +134,10 @@ class NetworkGameController(GameController):
         if dx != 0 or dy != 0:
             self.client.send_player_move(player.grid_x, player.grid_y, player.direction)
 
-        # Send bomb placement
-        if place_bomb and player.bombs_placed > 0:
-            # Find the bomb we just placed
-            for bomb in self.bombs:
-                if bomb.owner == player and bomb.timer == 3000:  # Just placed
-                    self.client.send_bomb_placed(bomb.grid_x, bomb.grid_y, bomb.power)
-                    break
+        # Send bomb placement: a just-placed bomb is simply the last append
+        if place_bomb and len(self.bombs) > bombs_before:
+            bomb = self.bombs[-1]
+            self.client.send_bomb_placed(bomb.grid_x, bomb.grid_y, bomb.power)
 
     def update(self, dt):
         """Override to handle network state"""
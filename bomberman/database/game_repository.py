@@ -3,44 +3,51 @@
 Game Repository - Handles game statistics and leaderboard operations
 """
 
+import heapq
+import logging
+
+from dataclasses import dataclass
 from database.repository import Repository
 
+logger = logging.getLogger(__name__)
+
+
+# Entities are slotted dataclasses with fields in table column order, so
+# bulk reads can construct them positionally from tuple rows
 
+
+@dataclass(slots=True)
 class GameStats:
     """Game statistics entity"""
-
-    def __init__(self, stat_id=None, user_id=None, wins=0, losses=0, total_games=0):
-        self.stat_id = stat_id
-        self.user_id = user_id
-        self.wins = wins
-        self.losses = losses
-        self.total_games = total_games
+    stat_id: int = None
+    user_id: int = None
+    wins: int = 0
+    losses: int = 0
+    total_games: int = 0
 
     def __repr__(self):
         return f"GameStats(user_id={self.user_id}, W:{self.wins} L:{self.losses} T:{self.total_games})"
 
 
+@dataclass(slots=True)
 class LeaderboardEntry:
     """Leaderboard entry entity"""
-
-    def __init__(self, score_id=None, user_id=None, username=None, score=0, game_date=None):
-        self.score_id = score_id
-        self.user_id = user_id
-        self.username = username
-        self.score = score
-        self.game_date = game_date
+    score_id: int = None
+    user_id: int = None
+    username: str = None
+    score: int = 0
+    game_date: object = None
 
     def __repr__(self):
         return f"LeaderboardEntry({self.username}: {self.score} pts)"
 
 
+@dataclass(slots=True)
 class UserPreferences:
     """User preferences entity"""
-
-    def __init__(self, pref_id=None, user_id=None, theme='desert'):
-        self.pref_id = pref_id
-        self.user_id = user_id
-        self.theme = theme
+    pref_id: int = None
+    user_id: int = None
+    theme: str = 'desert'
 
     def __repr__(self):
         return f"UserPreferences(user_id={self.user_id}, theme='{self.theme}')"
@@ -52,11 +59,26 @@ class GameRepository(Repository):
     Handles stats, leaderboard, and preferences.
     """
 
+    # Size of the in-memory top-score structure serving get_leaderboard
+    TOP_K = 10
+
+    def __init__(self):
+        super().__init__()
+        # user_id -> username, fetched once per session for add_score
+        self._username_cache = {}
+        # user_id -> UserPreferences; themes change rarely, so scene
+        # switches read from here instead of the database
+        self._pref_cache = {}
+        # Min-heap of (score, score_id, entry) holding the current top K;
+        # loaded lazily from the DB, then maintained on add_score so
+        # leaderboard reads skip the database entirely
+        self._top_k = None
+
     # Game Stats Methods
 
     def find_by_id(self, stat_id):
         """Find stats by ID"""
-        query = "SELECT * FROM game_stats WHERE stat_id = %s"
+        query = "SELECT stat_id, user_id, wins, losses, total_games FROM game_stats WHERE stat_id = %s"
         results = self.execute_query(query, (stat_id,))
 
         if results:
@@ -80,7 +102,7 @@ class GameRepository(Repository):
         Returns:
             GameStats: Stats object or None
         """
-        query = "SELECT * FROM game_stats WHERE user_id = %s"
+        query = "SELECT stat_id, user_id, wins, losses, total_games FROM game_stats WHERE user_id = %s"
         results = self.execute_query(query, (user_id,))
 
         if results:
@@ -96,19 +118,31 @@ class GameRepository(Repository):
 
     def find_all(self):
         """Get all game stats"""
-        query = "SELECT * FROM game_stats"
-        results = self.execute_query(query)
+        query = "SELECT stat_id, user_id, wins, losses, total_games FROM game_stats"
+        return [GameStats(*row) for row in self.execute_query_rows(query)]
 
-        stats_list = []
-        for row in results:
-            stats_list.append(GameStats(
-                stat_id=row['stat_id'],
-                user_id=row['user_id'],
-                wins=row['wins'],
-                losses=row['losses'],
-                total_games=row['total_games']
-            ))
-        return stats_list
+    def iter_all(self):
+        """
+        Stream all game stats one row at a time.
+
+        Rows come off an unbuffered cursor as they are consumed, so
+        memory stays O(1) in the table size.
+
+        Yields:
+            GameStats: One stats entity per row
+        """
+        connection = self.get_connection()
+        if not connection:
+            return
+        try:
+            cursor = connection.cursor()
+            cursor.execute(
+                "SELECT stat_id, user_id, wins, losses, total_games FROM game_stats")
+            for row in cursor:
+                yield GameStats(*row)
+            cursor.close()
+        finally:
+            connection.close()
 
     def save(self, stats):
         """Save new game stats"""
@@ -128,23 +162,20 @@ class GameRepository(Repository):
         Returns:
             bool: True if successful
         """
-        if won:
-            query = """
-                UPDATE game_stats 
-                SET wins = wins + 1, total_games = total_games + 1 
-                WHERE user_id = %s
-            """
-        else:
-            query = """
-                UPDATE game_stats 
-                SET losses = losses + 1, total_games = total_games + 1 
-                WHERE user_id = %s
-            """
-
-        affected = self.execute_update(query, (user_id,))
+        # Atomic upsert: creates the stats row on a user's first game and
+        # increments it afterwards, one statement for both outcomes
+        query = """
+            INSERT INTO game_stats (user_id, wins, losses, total_games)
+            VALUES (%s, %s, %s, 1)
+            ON DUPLICATE KEY UPDATE
+                wins = wins + VALUES(wins),
+                losses = losses + VALUES(losses),
+                total_games = total_games + 1
+        """
+
+        affected = self.execute_update(query, (user_id, 1 if won else 0, 0 if won else 1))
         if affected:
-            result = "won" if won else "lost"
-            print(f"✅ Stats updated: User {user_id} {result}")
+            logger.debug("Stats updated: user=%s result=%s", user_id, "won" if won else "lost")
         return affected > 0
 
     def delete(self, stat_id):
@@ -165,13 +196,54 @@ class GameRepository(Repository):
         Returns:
             int: Score ID
         """
-        query = "INSERT INTO leaderboard (user_id, score) VALUES (%s, %s)"
-        score_id = self.execute_update(query, (user_id, score))
+        username = self._get_username(user_id)
+        query = "INSERT INTO leaderboard (user_id, username, score) VALUES (%s, %s, %s)"
+        score_id = self.execute_update(query, (user_id, username, score))
 
         if score_id:
-            print(f"✅ Score added: User {user_id} scored {score}")
+            if self._top_k is not None:
+                entry = LeaderboardEntry(score_id, user_id, username, score, None)
+                if len(self._top_k) < self.TOP_K:
+                    heapq.heappush(self._top_k, (score, score_id, entry))
+                elif score > self._top_k[0][0]:
+                    heapq.heapreplace(self._top_k, (score, score_id, entry))
+            logger.debug("Score added: user=%s score=%s", user_id, score)
         return score_id
 
+    def add_scores(self, entries):
+        """
+        Bulk-insert leaderboard scores in one round-trip.
+
+        Useful for match-end bursts: one executemany INSERT and one
+        commit instead of a round-trip per score.
+
+        Args:
+            entries (list): (user_id, score) pairs
+
+        Returns:
+            int: Number of scores inserted
+        """
+        rows = [(user_id, self._get_username(user_id), score)
+                for user_id, score in entries]
+        affected = self.execute_batch(
+            "INSERT INTO leaderboard (user_id, username, score) VALUES (%s, %s, %s)",
+            rows)
+        if affected:
+            # Batch rows have no score_ids back, so re-seed the heap lazily
+            self._top_k = None
+            logger.debug("Bulk added %s scores", affected)
+        return affected
+
+    def _get_username(self, user_id):
+        """Look up a username for the snapshot column, cached per session"""
+        username = self._username_cache.get(user_id)
+        if username is None:
+            results = self.execute_query(
+                "SELECT username FROM users WHERE user_id = %s", (user_id,))
+            username = results[0]['username'] if results else ''
+            self._username_cache[user_id] = username
+        return username
+
     def get_leaderboard(self, limit=10):
         """
         Get top scores from leaderboard.
@@ -182,25 +254,36 @@ class GameRepository(Repository):
         Returns:
             list: List of LeaderboardEntry objects
         """
+        # Reads far outnumber score inserts, so the usual case is served
+        # from the in-memory top-K heap maintained by add_score
+        if limit <= self.TOP_K:
+            if self._top_k is None:
+                self._load_top_k()
+            ordered = sorted(self._top_k, key=lambda item: item[0], reverse=True)
+            return [item[2] for item in ordered[:limit]]
+
+        # Username is denormalized onto the leaderboard row, so this is a
+        # single index range scan with no JOIN
         query = """
-            SELECT l.score_id, l.user_id, u.username, l.score, l.game_date
-            FROM leaderboard l
-            JOIN users u ON l.user_id = u.user_id
-            ORDER BY l.score DESC
+            SELECT score_id, user_id, username, score, game_date
+            FROM leaderboard
+            ORDER BY score DESC
             LIMIT %s
         """
-        results = self.execute_query(query, (limit,))
+        return [LeaderboardEntry(*row)
+                for row in self.execute_query_rows(query, (limit,))]
 
-        leaderboard = []
-        for row in results:
-            leaderboard.append(LeaderboardEntry(
-                score_id=row['score_id'],
-                user_id=row['user_id'],
-                username=row['username'],
-                score=row['score'],
-                game_date=row['game_date']
-            ))
-        return leaderboard
+    def _load_top_k(self):
+        """Seed the top-K heap from the database once per session"""
+        query = """
+            SELECT score_id, user_id, username, score, game_date
+            FROM leaderboard
+            ORDER BY score DESC
+            LIMIT %s
+        """
+        rows = self.execute_query_rows(query, (self.TOP_K,))
+        self._top_k = [(row[3], row[0], LeaderboardEntry(*row)) for row in rows]
+        heapq.heapify(self._top_k)
 
     def get_user_best_score(self, user_id):
         """
@@ -231,17 +314,22 @@ class GameRepository(Repository):
         Returns:
             UserPreferences: Preferences object or None
         """
-        query = "SELECT * FROM user_preferences WHERE user_id = %s"
+        if user_id in self._pref_cache:
+            return self._pref_cache[user_id]
+
+        query = "SELECT pref_id, user_id, theme FROM user_preferences WHERE user_id = %s"
         results = self.execute_query(query, (user_id,))
 
+        prefs = None
         if results:
             row = results[0]
-            return UserPreferences(
+            prefs = UserPreferences(
                 pref_id=row['pref_id'],
                 user_id=row['user_id'],
                 theme=row['theme']
             )
-        return None
+        self._pref_cache[user_id] = prefs
+        return prefs
 
     def update_theme(self, user_id, theme):
         """
@@ -258,7 +346,8 @@ class GameRepository(Repository):
         affected = self.execute_update(query, (theme, user_id))
 
         if affected:
-            print(f"✅ Theme updated: User {user_id} → {theme}")
+            self._pref_cache.pop(user_id, None)
+            logger.debug("Theme updated: user=%s theme=%s", user_id, theme)
         return affected > 0
 
 
@@ -4,9 +4,13 @@ Repository Pattern - Base Repository
 Abstracts database operations and provides a clean interface
 """
 
+import logging
+
 from abc import ABC, abstractmethod
 from patterns.creational.singleton import DatabaseConnection
 
+logger = logging.getLogger(__name__)
+
 
 class Repository(ABC):
     """
@@ -14,13 +18,63 @@ class Repository(ABC):
     All repositories inherit from this class.
     """
 
+    # Sentinel: marks a parameter that should be replaced with the first
+    # statement's auto-generated id inside execute_many
+    LAST_ID = object()
+
     def __init__(self):
         self.db = DatabaseConnection()
+        # Server-side prepared statements, one cursor per query string,
+        # kept alive on a dedicated pooled connection so hot queries skip
+        # the SQL parse/plan step after their first execution
+        self._stmt_conn = None
+        self._stmt_cache = {}
 
     def get_connection(self):
-        """Get database connection"""
+        """Borrow a connection from the pool; close() returns it"""
         return self.db.get_connection()
 
+    def _get_prepared_cursor(self, query, dictionary=True):
+        """
+        Get a server-side prepared cursor for a query, preparing and
+        caching it on first use.
+
+        Args:
+            query (str): SQL query
+            dictionary (bool): Return rows as dicts (False for raw tuples)
+
+        Returns:
+            cursor: Prepared cursor, or None without a connection
+        """
+        key = (query, dictionary)
+        cursor = self._stmt_cache.get(key)
+        if cursor is not None:
+            return cursor
+
+        if self._stmt_conn is None:
+            self._stmt_conn = self.get_connection()
+            if self._stmt_conn is None:
+                return None
+
+        cursor = self._stmt_conn.cursor(dictionary=dictionary, prepared=True)
+        self._stmt_cache[key] = cursor
+        return cursor
+
+    def _invalidate_statements(self):
+        """Drop cached prepared cursors, e.g. after a connection error"""
+        for cursor in self._stmt_cache.values():
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        self._stmt_cache.clear()
+        if self._stmt_conn is not None:
+            try:
+                self._stmt_conn.close()
+            except Exception:
+                pass
+            self._stmt_conn = None
+
     def execute_query(self, query, params=None):
         """
         Execute a SELECT query and return results.
@@ -33,15 +87,38 @@ class Repository(ABC):
             list: Query results
         """
         try:
-            connection = self.get_connection()
-            if connection:
-                cursor = connection.cursor(dictionary=True)
+            cursor = self._get_prepared_cursor(query)
+            if cursor:
                 cursor.execute(query, params or ())
-                result = cursor.fetchall()
-                cursor.close()
-                return result
+                return cursor.fetchall()
         except Exception as e:
-            print(f"❌ Query error: {e}")
+            logger.error("Query error: %s", e)
+            # The held connection may have died; re-prepare on next call
+            self._invalidate_statements()
+            return []
+
+    def execute_query_rows(self, query, params=None):
+        """
+        Execute a SELECT query and return rows as plain tuples.
+
+        Bulk paths use this to skip per-row dict materialization and
+        construct entities positionally from the column order.
+
+        Args:
+            query (str): SQL query
+            params (tuple): Query parameters
+
+        Returns:
+            list: Rows as tuples
+        """
+        try:
+            cursor = self._get_prepared_cursor(query, dictionary=False)
+            if cursor:
+                cursor.execute(query, params or ())
+                return cursor.fetchall()
+        except Exception as e:
+            logger.error("Query error: %s", e)
+            self._invalidate_statements()
             return []
 
     def execute_update(self, query, params=None):
@@ -55,7 +132,7 @@ class Repository(ABC):
         Returns:
             int: Last inserted ID or affected rows
         """
-        global connection
+        connection = None
         try:
             connection = self.get_connection()
             if connection:
@@ -67,9 +144,86 @@ class Repository(ABC):
                 cursor.close()
                 return last_id if last_id > 0 else affected
         except Exception as e:
-            print(f"❌ Update error: {e}")
-            connection.rollback()
+            logger.error("Update error: %s", e)
+            if connection is not None:
+                connection.rollback()
+            return 0
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def execute_many(self, queries_and_params):
+        """
+        Execute several write statements in a single transaction.
+
+        One cursor runs all statements and the connection commits once,
+        instead of one commit round-trip per statement. Statements after
+        the first may use Repository.LAST_ID in their params to reference
+        the first statement's auto-generated id.
+
+        Args:
+            queries_and_params (list): List of (query, params) tuples
+
+        Returns:
+            int: Last inserted ID of the first statement, or 0 on error
+        """
+        connection = None
+        try:
+            connection = self.get_connection()
+            if connection:
+                cursor = connection.cursor()
+                first_id = 0
+                for i, (query, params) in enumerate(queries_and_params):
+                    if i > 0 and params:
+                        params = tuple(first_id if p is self.LAST_ID else p
+                                       for p in params)
+                    cursor.execute(query, params or ())
+                    if i == 0:
+                        first_id = cursor.lastrowid
+                connection.commit()
+                cursor.close()
+                return first_id
+        except Exception as e:
+            logger.error("Transaction error: %s", e)
+            if connection:
+                connection.rollback()
+            return 0
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def execute_batch(self, query, param_seq):
+        """
+        Execute one statement for many parameter rows via executemany.
+
+        The driver folds multi-row INSERTs into a single statement and
+        the connection commits once instead of once per row.
+
+        Args:
+            query (str): SQL query
+            param_seq (iterable): One params tuple per row
+
+        Returns:
+            int: Affected row count, or 0 on error
+        """
+        connection = None
+        try:
+            connection = self.get_connection()
+            if connection:
+                cursor = connection.cursor()
+                cursor.executemany(query, list(param_seq))
+                connection.commit()
+                affected = cursor.rowcount
+                cursor.close()
+                return affected
+        except Exception as e:
+            logger.error("Batch error: %s", e)
+            if connection is not None:
+                connection.rollback()
             return 0
+        finally:
+            if connection is not None:
+                connection.close()
 
     @abstractmethod
     def find_by_id(self, entity_id):
@@ -4,17 +4,36 @@ User Repository - Handles all user-related database operations
 """
 
 import hashlib
+import hmac
+import logging
+import os
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from database.repository import Repository
 
+logger = logging.getLogger(__name__)
 
-class User:
-    """User entity class"""
+# scrypt cost parameters: low enough to keep login latency interactive,
+# high enough to be GPU-hostile (unlike the old single-round SHA-256)
+_SCRYPT_N = 2 ** 14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+
+
+@lru_cache(maxsize=1024)
+def _sha256_hex(password):
+    """Hash a password string, memoized so repeated logins skip the digest"""
+    return hashlib.sha256(password.encode()).hexdigest()
 
-    def __init__(self, user_id=None, username=None, password_hash=None, created_at=None):
-        self.user_id = user_id
-        self.username = username
-        self.password_hash = password_hash
-        self.created_at = created_at
+
+@dataclass(slots=True)
+class User:
+    """User entity class (fields in users table column order)"""
+    user_id: int = None
+    username: str = None
+    password_hash: str = None
+    created_at: object = None
 
     def __repr__(self):
         return f"User(id={self.user_id}, username='{self.username}')"
@@ -26,6 +45,14 @@ class UserRepository(Repository):
     Implements CRUD operations for users.
     """
 
+    # How long a cached username lookup stays valid (seconds)
+    USER_CACHE_TTL = 30
+
+    def __init__(self):
+        super().__init__()
+        # username -> (User or None, expiry timestamp); writes invalidate
+        self._user_cache = {}
+
     def find_by_id(self, user_id):
         """
         Find user by ID.
@@ -36,7 +63,7 @@ class UserRepository(Repository):
         Returns:
             User: User object or None
         """
-        query = "SELECT * FROM users WHERE user_id = %s"
+        query = "SELECT user_id, username, password_hash, created_at FROM users WHERE user_id = %s"
         results = self.execute_query(query, (user_id,))
 
         if results:
@@ -59,18 +86,24 @@ class UserRepository(Repository):
         Returns:
             User: User object or None
         """
-        query = "SELECT * FROM users WHERE username = %s"
+        cached = self._user_cache.get(username)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        query = "SELECT user_id, username, password_hash, created_at FROM users WHERE username = %s"
         results = self.execute_query(query, (username,))
 
+        user = None
         if results:
             row = results[0]
-            return User(
+            user = User(
                 user_id=row['user_id'],
                 username=row['username'],
                 password_hash=row['password_hash'],
                 created_at=row['created_at']
             )
-        return None
+        self._user_cache[username] = (user, time.monotonic() + self.USER_CACHE_TTL)
+        return user
 
     def find_all(self):
         """
@@ -79,18 +112,32 @@ class UserRepository(Repository):
         Returns:
             list: List of User objects
         """
-        query = "SELECT * FROM users"
-        results = self.execute_query(query)
+        query = "SELECT user_id, username, password_hash, created_at FROM users"
+        return [User(*row) for row in self.execute_query_rows(query)]
 
-        users = []
-        for row in results:
-            users.append(User(
-                user_id=row['user_id'],
-                username=row['username'],
-                password_hash=row['password_hash'],
-                created_at=row['created_at']
-            ))
-        return users
+    def iter_all(self):
+        """
+        Stream all users one row at a time.
+
+        Unlike find_all, this never materializes the full result set;
+        rows come off an unbuffered cursor as they are consumed, so
+        memory stays O(1) in the table size.
+
+        Yields:
+            User: One user per row
+        """
+        connection = self.get_connection()
+        if not connection:
+            return
+        try:
+            cursor = connection.cursor()
+            cursor.execute(
+                "SELECT user_id, username, password_hash, created_at FROM users")
+            for row in cursor:
+                yield User(*row)
+            cursor.close()
+        finally:
+            connection.close()
 
     def save(self, user):
         """
@@ -102,16 +149,19 @@ class UserRepository(Repository):
         Returns:
             int: New user ID
         """
-        query = "INSERT INTO users (username, password_hash) VALUES (%s, %s)"
-        user_id = self.execute_update(query, (user.username, user.password_hash))
+        # One transaction creates the user plus its default preferences
+        # row; game_stats rows appear lazily via update_stats' upsert
+        user_id = self.execute_many([
+            ("INSERT INTO users (username, password_hash) VALUES (%s, %s)",
+             (user.username, user.password_hash)),
+            ("INSERT INTO user_preferences (user_id, theme) VALUES (%s, 'desert')",
+             (self.LAST_ID,)),
+        ])
 
         if user_id:
             user.user_id = user_id
-            print(f"✅ User created: {user.username} (ID: {user_id})")
-
-            # Also create default entries in related tables
-            self._create_default_stats(user_id)
-            self._create_default_preferences(user_id)
+            self._user_cache.pop(user.username, None)
+            logger.debug("User created: %s (ID: %s)", user.username, user_id)
 
         return user_id
 
@@ -127,6 +177,8 @@ class UserRepository(Repository):
         """
         query = "UPDATE users SET username = %s, password_hash = %s WHERE user_id = %s"
         affected = self.execute_update(query, (user.username, user.password_hash, user.user_id))
+        if affected:
+            self._user_cache.pop(user.username, None)
         return affected > 0
 
     def delete(self, user_id):
@@ -143,7 +195,9 @@ class UserRepository(Repository):
         affected = self.execute_update(query, (user_id,))
 
         if affected:
-            print(f"✅ User deleted (ID: {user_id})")
+            # Only the id is known here, so drop the whole lookup cache
+            self._user_cache.clear()
+            logger.debug("User deleted (ID: %s)", user_id)
         return affected > 0
 
     def authenticate(self, username, password):
@@ -160,14 +214,13 @@ class UserRepository(Repository):
         user = self.find_by_username(username)
 
         if user:
-            password_hash = self._hash_password(password)
-            if user.password_hash == password_hash:
-                print(f"✅ User authenticated: {username}")
+            if self._verify_password(password, user.password_hash):
+                logger.debug("User authenticated: %s", username)
                 return user
             else:
-                print(f"❌ Invalid password for user: {username}")
+                logger.debug("Invalid password for user: %s", username)
         else:
-            print(f"❌ User not found: {username}")
+            logger.debug("User not found: %s", username)
 
         return None
 
@@ -175,6 +228,11 @@ class UserRepository(Repository):
         """
         Register a new user.
 
+        The duplicate check rides on the UNIQUE index: the INSERT's
+        ON DUPLICATE KEY clause is a no-op whose rowcount distinguishes
+        a fresh row (1) from an existing username, so there is no
+        pre-check SELECT and no check-then-insert race.
+
         Args:
             username (str): Username
             password (str): Plain text password
@@ -182,40 +240,102 @@ class UserRepository(Repository):
         Returns:
             User: New user object or None if username exists
         """
-        # Check if username already exists
-        existing_user = self.find_by_username(username)
-        if existing_user:
-            print(f"❌ Username already exists: {username}")
+        password_hash = self._hash_password(password)
+        connection = None
+        try:
+            connection = self.get_connection()
+            if not connection:
+                return None
+            cursor = connection.cursor()
+            cursor.execute(
+                "INSERT INTO users (username, password_hash) VALUES (%s, %s) "
+                "ON DUPLICATE KEY UPDATE user_id = LAST_INSERT_ID(user_id)",
+                (username, password_hash))
+            if cursor.rowcount != 1:
+                connection.rollback()
+                cursor.close()
+                logger.debug("Username already exists: %s", username)
+                return None
+
+            user_id = cursor.lastrowid
+            cursor.execute(
+                "INSERT INTO user_preferences (user_id, theme) VALUES (%s, 'desert')",
+                (user_id,))
+            connection.commit()
+            cursor.close()
+
+            self._user_cache.pop(username, None)
+            logger.debug("User created: %s (ID: %s)", username, user_id)
+            return User(user_id=user_id, username=username,
+                        password_hash=password_hash)
+        except Exception as e:
+            logger.error("Register error: %s", e)
+            if connection is not None:
+                connection.rollback()
             return None
+        finally:
+            if connection is not None:
+                connection.close()
 
-        # Create new user
-        password_hash = self._hash_password(password)
-        user = User(username=username, password_hash=password_hash)
-        self.save(user)
+    def register_many(self, credentials):
+        """
+        Bulk-register users in one round-trip (seeding/imports).
 
-        return user
+        Passwords are pre-hashed in Python, then a single executemany
+        INSERT commits once for the whole batch. Existing usernames are
+        skipped; preference rows fall back to defaults until first use.
+
+        Args:
+            credentials (list): (username, password) pairs
+
+        Returns:
+            int: Number of users inserted
+        """
+        rows = [(username, self._hash_password(password))
+                for username, password in credentials]
+        inserted = self.execute_batch(
+            "INSERT IGNORE INTO users (username, password_hash) VALUES (%s, %s)",
+            rows)
+        if inserted:
+            self._user_cache.clear()
+            logger.debug("Bulk registered %s users", inserted)
+        return inserted
 
     def _hash_password(self, password):
         """
-        Hash password using SHA-256.
+        Hash password using salted scrypt (OpenSSL-backed via hashlib).
 
         Args:
             password (str): Plain text password
 
         Returns:
-            str: Hashed password
+            str: Hash in the form 'scrypt$<salt_hex>$<digest_hex>'
         """
-        return hashlib.sha256(password.encode()).hexdigest()
+        salt = os.urandom(16)
+        digest = hashlib.scrypt(password.encode(), salt=salt,
+                                n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P)
+        return f"scrypt${salt.hex()}${digest.hex()}"
 
-    def _create_default_stats(self, user_id):
-        """Create default stats for new user"""
-        query = "INSERT INTO game_stats (user_id) VALUES (%s)"
-        self.execute_update(query, (user_id,))
+    def _verify_password(self, password, stored_hash):
+        """
+        Check a password against a stored hash.
 
-    def _create_default_preferences(self, user_id):
-        """Create default preferences for new user"""
-        query = "INSERT INTO user_preferences (user_id, theme) VALUES (%s, 'desert')"
-        self.execute_update(query, (user_id,))
+        Args:
+            password (str): Plain text password
+            stored_hash (str): Hash from the users table
+
+        Returns:
+            bool: True if the password matches
+        """
+        if stored_hash.startswith('scrypt$'):
+            _, salt_hex, digest_hex = stored_hash.split('$')
+            digest = hashlib.scrypt(password.encode(),
+                                    salt=bytes.fromhex(salt_hex),
+                                    n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P)
+            return hmac.compare_digest(digest.hex(), digest_hex)
+
+        # Legacy rows: unsalted SHA-256 from before the scrypt switch
+        return hmac.compare_digest(_sha256_hex(password), stored_hash)
 
 
 # Usage Example
@@ -7,7 +7,8 @@ CREATE TABLE users (
 
 CREATE TABLE game_stats (
   stat_id INT AUTO_INCREMENT PRIMARY KEY,
-  user_id INT NOT NULL,
+  -- One stats row per user; UNIQUE lets update_stats upsert on it
+  user_id INT NOT NULL UNIQUE,
   wins INT DEFAULT 0,
   losses INT DEFAULT 0,
   total_games INT DEFAULT 0,
@@ -17,11 +18,19 @@ CREATE TABLE game_stats (
 CREATE TABLE leaderboard (
   score_id INT AUTO_INCREMENT PRIMARY KEY,
   user_id INT NOT NULL,
+  -- Username snapshot taken when the score is recorded, so reads skip
+  -- the JOIN against users (high-score tables keep snapshot semantics)
+  username VARCHAR(64) NOT NULL,
   score INT NOT NULL,
   game_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   FOREIGN KEY (user_id) REFERENCES users(user_id)
 );
 
+-- Top-N queries walk this index instead of sorting the whole table
+CREATE INDEX idx_lb_score_desc ON leaderboard (score DESC, user_id);
+-- MAX(score) per user becomes a single index seek
+CREATE INDEX idx_lb_user_score ON leaderboard (user_id, score DESC);
+
 CREATE TABLE user_preferences (
   pref_id INT AUTO_INCREMENT PRIMARY KEY,
   user_id INT NOT NULL,
@@ -6,14 +6,15 @@ Implements all 9 Design Patterns + Bonus Features
 
 import pygame
 from controllers.game_controller import GameController
-from controllers.network_controller import NetworkGameController
 from views.game_view import GameView
 from views.menu_view import MenuView
-from views.leaderboard_view import LeaderboardView
 from database.user_repository import UserRepository
-from database.game_repository import GameRepository
 from config import *
 
+# NetworkGameController (socket stack), LeaderboardView and GameRepository
+# are imported lazily on first use: most sessions never touch online mode
+# or the leaderboard, so startup skips their import and connection cost
+
 
 def _print_welcome():
     """Print welcome message"""
@@ -56,17 +57,27 @@ class BombermanGame:
         pygame.display.set_caption("Bomberman - All Design Patterns")
         self.clock = pygame.time.Clock()
 
+        # The game only reads keyboard and quit events, so keep mouse/joystick
+        # spam out of the event queue instead of dequeuing and ignoring it
+        pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.ACTIVEEVENT,
+                                  pygame.VIDEOEXPOSE, pygame.JOYAXISMOTION,
+                                  pygame.JOYBALLMOTION, pygame.JOYHATMOTION])
+        pygame.event.set_allowed([pygame.KEYDOWN, pygame.KEYUP, pygame.QUIT])
+
         # Views
         self.game_view = GameView(self.screen)
         self.menu_view = MenuView(self.screen)
-        self.leaderboard_view = LeaderboardView(self.screen)
+        self.leaderboard_view = None  # created on first leaderboard visit
 
         # Controllers
         self.controller = None
+        # Whether the active controller is a NetworkGameController; hoisted
+        # to a flag so the input loop skips per-frame isinstance checks
+        self._is_network = False
 
-        # Repositories
+        # Repositories (game_repo is created lazily via the property below)
         self.user_repo = UserRepository()
-        self.game_repo = GameRepository()
+        self._game_repo = None
 
         # Game state
         self.running = True
@@ -77,31 +88,95 @@ class BombermanGame:
 
         # User data
         self.current_user = None
-        self.username_input = ""
+        # Login input as a char list: append/pop per keypress instead of
+        # rebuilding an immutable string
+        self._username_chars = []
+
+        # Leaderboard rows shown on the leaderboard screen, refreshed at
+        # most every 2s instead of one repository query per frame
+        self._leaderboard_cache = None
+        self._leaderboard_expiry = 0
+
+        # What the static screens last drew; re-rendering is skipped while
+        # the (screen, state) key is unchanged. Any screen switch changes
+        # the key, so no explicit invalidation is needed
+        self._last_static_render = None
+
+        # Screen dispatch table: one dict lookup per frame instead of an
+        # if/elif ladder of string compares in run()
+        self._screen_handlers = {
+            'main_menu': self._handle_main_menu,
+            'login': self._handle_login,
+            'theme_select': self._handle_theme_select,
+            'game': self._handle_game,
+            'leaderboard': self._handle_leaderboard,
+            'waiting': self._handle_waiting,
+        }
 
         _print_welcome()
 
+    @property
+    def game_repo(self):
+        """Game repository, created on first use"""
+        if self._game_repo is None:
+            from database.game_repository import GameRepository
+            self._game_repo = GameRepository()
+        return self._game_repo
+
+    # Screens that render static content and only react to input; the
+    # waiting screen is excluded because it polls the network each frame
+    _IDLE_SCREENS = frozenset(('main_menu', 'login', 'theme_select',
+                               'leaderboard'))
+
+    # Idle wake-up cap in ms, so idle screens still repaint periodically
+    _IDLE_WAIT_MS = 100
+
     def run(self):
         """Main game loop"""
         while self.running:
-            dt = self.clock.tick(FPS)
-
-            if self.current_screen == 'main_menu':
-                self._handle_main_menu()
-            elif self.current_screen == 'login':
-                self._handle_login()
-            elif self.current_screen == 'theme_select':
-                self._handle_theme_select()
-            elif self.current_screen == 'game':
-                self._handle_game(dt)
-            elif self.current_screen == 'leaderboard':
-                self._handle_leaderboard()
-            elif self.current_screen == 'waiting':
-                self._handle_waiting()
-
+            if self.current_screen in self._IDLE_SCREENS:
+                # Sleep until input arrives instead of spinning at FPS.
+                # Only events the handlers actually consume go back on the
+                # queue; anything else would wake wait() again immediately
+                event = pygame.event.wait(self._IDLE_WAIT_MS)
+                if event.type in (pygame.QUIT, pygame.KEYDOWN):
+                    pygame.event.post(event)
+                # Mark the tick so dt stays sane when a live screen resumes
+                self.clock.tick()
+                dt = 0
+            else:
+                dt = self.clock.tick(FPS)
+
+            handler = self._screen_handlers[self.current_screen]
+            if handler == self._handle_game:
+                handler(dt)
+            else:
+                handler()
+
+        self._save_asset_cache()
         pygame.quit()
         print("\n👋 Thanks for playing Bomberman!")
 
+    def _save_asset_cache(self):
+        """Persist generated sprites so the next run skips regeneration"""
+        import assets.asset_loader as asset_loader
+        if asset_loader._asset_loader is None:
+            return  # no game was played, nothing was loaded
+        try:
+            asset_loader._asset_loader.save_cache()
+        except Exception as e:
+            print(f"⚠️ Asset cache save failed: {e}")
+
+    def _poll_filtered(self, types=(pygame.QUIT, pygame.KEYDOWN)):
+        """
+        Pump SDL once and fetch only the event types this frame consumes.
+
+        The screen handlers only ever react to QUIT and KEYDOWN, so other
+        event types never cross the Python boundary as event objects.
+        """
+        pygame.event.pump()
+        return pygame.event.get(types)
+
     def _handle_main_menu(self):
         """Handle main menu"""
         menu_options = [
@@ -112,7 +187,7 @@ class BombermanGame:
             "5. Quit"
         ]
 
-        for event in pygame.event.get():
+        for event in self._poll_filtered():
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -124,7 +199,10 @@ class BombermanGame:
                 elif event.key == pygame.K_RETURN:
                     self._handle_menu_selection()
 
-        self.menu_view.render_main_menu(menu_options, self.selected_menu_option)
+        state = ('main_menu', self.selected_menu_option)
+        if state != self._last_static_render:
+            self.menu_view.render_main_menu(menu_options, self.selected_menu_option)
+            self._last_static_render = state
 
     def _handle_menu_selection(self):
         """Handle menu selection"""
@@ -153,22 +231,24 @@ class BombermanGame:
 
     def _handle_login(self):
         """Handle login screen"""
-        for event in pygame.event.get():
+        for event in self._poll_filtered():
             if event.type == pygame.QUIT:
                 self.running = False
 
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.current_screen = 'main_menu'
-                    self.username_input = ""
+                    self._username_chars.clear()
+
+                elif event.key == pygame.K_RETURN and self._username_chars:
+                    username = ''.join(self._username_chars)
 
-                elif event.key == pygame.K_RETURN and self.username_input:
                     # Try to authenticate or register
-                    user = self.user_repo.find_by_username(self.username_input)
+                    user = self.user_repo.find_by_username(username)
 
                     if not user:
                         # Register new user
-                        user = self.user_repo.register(self.username_input, "default_pass")
+                        user = self.user_repo.register(username, "default_pass")
 
                     self.current_user = user
 
@@ -179,21 +259,25 @@ class BombermanGame:
                         self.current_screen = 'theme_select'
 
                 elif event.key == pygame.K_BACKSPACE:
-                    self.username_input = self.username_input[:-1]
+                    if self._username_chars:
+                        self._username_chars.pop()
 
                 else:
-                    # Add character to username
-                    if len(self.username_input) < 15 and event.unicode.isprintable():
-                        self.username_input += event.unicode
+                    # Add character to username (printable ASCII only; a
+                    # two-compare range check beats a unicode category scan)
+                    ch = event.unicode
+                    if ch and 0x20 <= ord(ch) < 0x7F and \
+                            len(self._username_chars) < 15:
+                        self._username_chars.append(ch)
 
-        self.menu_view.render_login(self.username_input, True)
+        self.menu_view.render_login(''.join(self._username_chars), True)
 
     def _handle_theme_select(self):
         """Handle theme selection screen"""
         themes = ['desert', 'forest', 'city']
         theme_names = ['1. Desert Theme', '2. Forest Theme', '3. City Theme']
         
-        for event in pygame.event.get():
+        for event in self._poll_filtered():
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -217,7 +301,10 @@ class BombermanGame:
                     elif self.game_mode == 'online':
                         self._start_online_game()
         
-        self.menu_view.render_menu('Select Theme', theme_names, self.selected_menu_option)
+        state = ('theme_select', self.selected_menu_option)
+        if state != self._last_static_render:
+            self.menu_view.render_menu('Select Theme', theme_names, self.selected_menu_option)
+            self._last_static_render = state
 
     def _start_single_game(self):
         """Start single player game"""
@@ -229,6 +316,7 @@ class BombermanGame:
             theme=self.selected_theme,
             is_multiplayer=False
         )
+        self._is_network = False
         self.current_screen = 'game'
 
     def _start_local_game(self):
@@ -241,18 +329,21 @@ class BombermanGame:
             theme=self.selected_theme,
             is_multiplayer=False
         )
+        self._is_network = False
         self.current_screen = 'game'
 
     def _start_online_game(self):
         """Start online multiplayer game"""
         print(f"\n🌐 Starting Online Multiplayer for {self.current_user.username}...")
 
+        from controllers.network_controller import NetworkGameController
         try:
             self.controller = NetworkGameController(
                 username=self.current_user.username,
                 host=SERVER_HOST,
                 port=SERVER_PORT
             )
+            self._is_network = True
             self.current_screen = 'waiting'
         except Exception as e:
             print(f"❌ Connection error: {e}")
@@ -262,13 +353,18 @@ class BombermanGame:
 
     def _handle_waiting(self):
         """Handle waiting for opponent"""
-        for event in pygame.event.get():
+        for event in self._poll_filtered():
             if event.type == pygame.QUIT:
                 self.running = False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if hasattr(self.controller, 'disconnect'):
                         self.controller.disconnect()
+                    # A network controller only attaches observers once a
+                    # game actually starts, hence the hasattr guard
+                    if hasattr(self.controller, 'event_manager'):
+                        self.controller.shutdown()
+                    self.controller = None
                     self.current_screen = 'main_menu'
 
         # Check if game started
@@ -284,7 +380,18 @@ class BombermanGame:
             self.current_screen = 'main_menu'
             return
 
-        for event in pygame.event.get():
+        # Input is sampled right before the simulation step (tick -> poll
+        # -> update), so what update() sees is this frame's input, not
+        # the state from before the FPS sleep
+        self._collect_input_game()
+
+        # Input handling may have ended or restarted the game
+        if self.controller is not None and self.current_screen == 'game':
+            self._step_game(dt)
+
+    def _collect_input_game(self):
+        """Poll events and keyboard state for the game screen"""
+        for event in self._poll_filtered():
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -301,67 +408,70 @@ class BombermanGame:
                 if event.key == pygame.K_r and self.controller.game_over:
                     self._restart_game()
 
-                # Player 1 bomb (only if not paused)
-                if not self.controller.paused and event.key == self.controller.player1_controls['bomb']:
-                    self.controller.handle_input(1, 0, 0, place_bomb=True)
-
-                # Player 2 bomb (only if not paused and a second player exists)
-                if not self.controller.paused and len(self.controller.players) > 1 and event.key == self.controller.player2_controls['bomb']:
-                    if not isinstance(self.controller, NetworkGameController) or \
-                            self.controller.my_player_number == 2:
-                        self.controller.handle_input(2, 0, 0, place_bomb=True)
+                # Bomb keys resolve through the controller's dispatch table
+                if not self.controller.paused:
+                    action = self.controller.key_actions.get(event.key)
+                    if action is not None and action[1] == 'bomb':
+                        player_id = action[0]
+                        if player_id == 1:
+                            self.controller.handle_input(1, 0, 0, place_bomb=True)
+                        # Player 2 bomb only if a second player exists and we control it
+                        elif len(self.controller.players) > 1 and \
+                                (not self._is_network or
+                                 self.controller.my_player_number == 2):
+                            self.controller.handle_input(2, 0, 0, place_bomb=True)
 
         # Handle movement (only if not paused)
         if not self.controller.paused:
             keys = pygame.key.get_pressed()
 
-            # Player 1
-            dx1 = dy1 = 0
-            if keys[self.controller.player1_controls['left']]:
-                dx1 = -1
-            if keys[self.controller.player1_controls['right']]:
-                dx1 = 1
-            if keys[self.controller.player1_controls['up']]:
-                dy1 = -1
-            if keys[self.controller.player1_controls['down']]:
-                dy1 = 1
-
-            if dx1 != 0 or dy1 != 0:
+            # Player 1 (scancodes precomputed as (left, right, up, down));
+            # right-minus-left arithmetic on the key booleans replaces four
+            # conditionals per player
+            p1 = self.controller.player1_keys
+            dx1 = keys[p1[1]] - keys[p1[0]]
+            dy1 = keys[p1[3]] - keys[p1[2]]
+
+            if dx1 | dy1:
                 self.controller.handle_input(1, dx1, dy1)
 
             # Player 2 (only if a second player exists and we control it)
-            if len(self.controller.players) > 1 and (not isinstance(self.controller, NetworkGameController) or \
+            if len(self.controller.players) > 1 and (not self._is_network or
                     self.controller.my_player_number == 2):
-                dx2 = dy2 = 0
-                if keys[self.controller.player2_controls['left']]:
-                    dx2 = -1
-                if keys[self.controller.player2_controls['right']]:
-                    dx2 = 1
-                if keys[self.controller.player2_controls['up']]:
-                    dy2 = -1
-                if keys[self.controller.player2_controls['down']]:
-                    dy2 = 1
-
-                if dx2 != 0 or dy2 != 0:
+                p2 = self.controller.player2_keys
+                dx2 = keys[p2[1]] - keys[p2[0]]
+                dy2 = keys[p2[3]] - keys[p2[2]]
+
+                if dx2 | dy2:
                     self.controller.handle_input(2, dx2, dy2)
 
-        # Update and render
+    def _step_game(self, dt):
+        """Advance the simulation and render the frame"""
         self.controller.update(dt)
         game_state = self.controller.get_game_state()
         self.game_view.render(game_state)
 
     def _handle_leaderboard(self):
         """Handle leaderboard screen"""
-        for event in pygame.event.get():
+        for event in self._poll_filtered():
             if event.type == pygame.QUIT:
                 self.running = False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.current_screen = 'main_menu'
 
-        # Get leaderboard data
-        leaderboard = self.game_repo.get_leaderboard(10)
-        self.leaderboard_view.render(leaderboard)
+        # Get leaderboard data (cached between refreshes)
+        now = pygame.time.get_ticks()
+        if self._leaderboard_cache is None or now > self._leaderboard_expiry:
+            self._leaderboard_cache = self.game_repo.get_leaderboard(10)
+            self._leaderboard_expiry = now + 2000
+        state = ('leaderboard', self._leaderboard_expiry)
+        if state != self._last_static_render:
+            if self.leaderboard_view is None:
+                from views.leaderboard_view import LeaderboardView
+                self.leaderboard_view = LeaderboardView(self.screen)
+            self.leaderboard_view.render(self._leaderboard_cache)
+            self._last_static_render = state
 
     def _end_game(self):
         """End game and save statistics"""
@@ -370,19 +480,27 @@ class BombermanGame:
             won = self.controller.winner.name == self.current_user.username
             self.game_repo.update_stats(self.current_user.user_id, won)
 
-            # Save score
+            # Save score; the cached leaderboard may now be stale
             score = self.controller.score_observer.score
             self.game_repo.add_score(self.current_user.user_id, score)
+            self._leaderboard_cache = None
 
         # Disconnect if online
-        if isinstance(self.controller, NetworkGameController):
+        if self._is_network:
             self.controller.disconnect()
 
+        # Unsubscribe the game's observers so the finished controller is
+        # actually collectable and stops receiving later games' events
+        self.controller.shutdown()
         self.controller = None
+        self._is_network = False
         self.current_screen = 'main_menu'
 
     def _restart_game(self):
         """Restart current game"""
+        if self.controller is not None:
+            self.controller.shutdown()
+            self.controller = None
         if self.game_mode == 'single':
             self._start_single_game()
         elif self.game_mode == 'local':
@@ -4,8 +4,34 @@ Bomb model for the Bomberman game
 """
 
 import pygame
+from assets.asset_loader import get_asset_loader
 from config import TILE_SIZE, BOMB_TIMER
 
+# Fallback explosion surfaces keyed by direction, rasterized once on first
+# use; per-frame drawing is then set_alpha + blit on the shared surface
+_EXPLOSION_SURFS = {}
+
+
+def _explosion_surf(direction):
+    """Get (building on first use) the fallback surface for a direction"""
+    surface = _EXPLOSION_SURFS.get(direction)
+    if surface is None:
+        surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        if direction is None:
+            # Center explosion (circle)
+            pygame.draw.circle(surface, (255, 150, 0),
+                               (TILE_SIZE // 2, TILE_SIZE // 2),
+                               TILE_SIZE // 2)
+        elif direction in ('left', 'right'):
+            # Horizontal beam
+            pygame.draw.rect(surface, (255, 150, 0),
+                             (0, TILE_SIZE // 4, TILE_SIZE, TILE_SIZE // 2))
+        else:  # up or down
+            pygame.draw.rect(surface, (255, 150, 0),
+                             (TILE_SIZE // 4, 0, TILE_SIZE // 2, TILE_SIZE))
+        _EXPLOSION_SURFS[direction] = surface
+    return surface
+
 
 class Bomb:
     """
@@ -23,6 +49,22 @@ class Bomb:
             power (int): Explosion range in tiles
             owner (Player): Player who placed the bomb
         """
+        self.rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
+        # Sprite references cached once; the pooled reset() keeps them.
+        # _fuse_frames holds the 11 pre-baked sprite+fuse composites so
+        # draw() is one blit with no line/circle rasterization
+        try:
+            loader = get_asset_loader()
+            self._fuse_frames = loader.get_image('bomb_frames')
+            self._fuse_pad = loader.FUSE_PAD
+        except Exception:
+            self._fuse_frames = None
+
+        self.reset(x, y, power, owner)
+
+    def reset(self, x, y, power, owner):
+        """Re-arm this bomb in place so pooled instances skip reallocation"""
         self.grid_x = x
         self.grid_y = y
         self.power = power
@@ -31,14 +73,13 @@ class Bomb:
         # Pixel position for drawing
         self.x = x * TILE_SIZE
         self.y = y * TILE_SIZE
-        self.rect = pygame.Rect(self.x, self.y, TILE_SIZE, TILE_SIZE)
+        self.rect.topleft = (self.x, self.y)
 
         # Timer
         self.timer = BOMB_TIMER
         self.exploded = False
 
         # Animation
-        self.blink_timer = 0
         self.blink_visible = True
 
     def update(self, dt):
@@ -56,11 +97,9 @@ class Bomb:
 
         self.timer -= dt
 
-        # Blinking animation
-        self.blink_timer += dt
-        if self.blink_timer > 200:  # Blink every 200ms
-            self.blink_visible = not self.blink_visible
-            self.blink_timer = 0
+        # Blinking animation: derived from elapsed burn time, so there is
+        # no running accumulator to branch on (parity of 200ms intervals)
+        self.blink_visible = ((BOMB_TIMER - self.timer) // 200) % 2 == 0
 
         if self.timer <= 0:
             self.exploded = True
@@ -68,30 +107,44 @@ class Bomb:
 
         return False
 
+    @classmethod
+    def update_batch(cls, bombs, dt):
+        """
+        Advance every bomb one step in a single pass.
+
+        Splits the list instead of having the controller test a return
+        value per object, so the per-frame cost is one tight loop.
+
+        Args:
+            bombs (list): Active bombs
+            dt (int): Delta time in milliseconds
+
+        Returns:
+            tuple: (still ticking, just exploded) bomb lists
+        """
+        ticking = []
+        exploding = []
+        for bomb in bombs:
+            timer = bomb.timer - dt
+            bomb.timer = timer
+            bomb.blink_visible = ((BOMB_TIMER - timer) // 200) % 2 == 0
+            if timer <= 0:
+                bomb.exploded = True
+                exploding.append(bomb)
+            else:
+                ticking.append(bomb)
+        return ticking, exploding
+
     def draw(self, screen):
         """Draw the bomb on screen"""
         if not self.exploded and self.blink_visible:
-            try:
-                from assets.asset_loader import get_asset_loader
-                loader = get_asset_loader()
-                sprite = loader.get_image('bomb')
-
-                if sprite:
-                    screen.blit(sprite, (self.rect.x, self.rect.y))
-
-                    # Draw fuse on top
-                    fuse_length = int((self.timer / BOMB_TIMER) * 10)
-                    if fuse_length > 0:
-                        pygame.draw.line(screen, (255, 100, 0),
-                                         (self.rect.centerx, self.rect.centery - TILE_SIZE // 3),
-                                         (self.rect.centerx, self.rect.centery - TILE_SIZE // 3 - fuse_length),
-                                         2)
-                        # Spark
-                        pygame.draw.circle(screen, (255, 200, 0),
-                                           (self.rect.centerx, self.rect.centery - TILE_SIZE // 3 - fuse_length), 2)
-                else:
-                    self._draw_fallback(screen)
-            except:
+            if self._fuse_frames:
+                # Fuse length quantizes to 0..10, so the matching pre-baked
+                # composite is a single blit
+                fuse_length = min(int((self.timer / BOMB_TIMER) * 10), 10)
+                screen.blit(self._fuse_frames[fuse_length],
+                            (self.rect.x, self.rect.y - self._fuse_pad))
+            else:
                 self._draw_fallback(screen)
 
     def _draw_fallback(self, screen):
@@ -125,19 +178,31 @@ class Explosion:
             y (int): Grid Y position
             direction (str): Direction of explosion ('up', 'down', 'left', 'right', or None for center)
         """
+        self.rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
+        # Frame list reference cached once; the pooled reset() keeps it
+        try:
+            self._frames = get_asset_loader().get_image('explosion_frames')
+        except Exception:
+            self._frames = None
+
+        self.reset(x, y, direction)
+
+    def reset(self, x, y, direction=None):
+        """Restart this explosion in place so pooled instances skip reallocation"""
         self.grid_x = x
         self.grid_y = y
         self.direction = direction
 
         self.x = x * TILE_SIZE
         self.y = y * TILE_SIZE
-        self.rect = pygame.Rect(self.x, self.y, TILE_SIZE, TILE_SIZE)
+        self.rect.topleft = (self.x, self.y)
 
-        # Animation
+        # Animation: frame index is derived from elapsed time, so the
+        # only state is one accumulator (8 frames over 500ms => /64ms)
         self.duration = 500  # milliseconds
+        self.elapsed = 0
         self.frame = 0
-        self.frame_time = 0
-        self.frame_duration = 500 / 8  # 8 frames
 
     def update(self, dt):
         """
@@ -149,51 +214,47 @@ class Explosion:
         Returns:
             bool: True if explosion is finished
         """
-        self.duration -= dt
-        self.frame_time += dt
+        self.elapsed += dt
+        self.frame = self.elapsed >> 6
+
+        return self.elapsed >= self.duration
 
-        if self.frame_time >= self.frame_duration:
-            self.frame += 1
-            self.frame_time = 0
+    @classmethod
+    def update_batch(cls, explosions, dt):
+        """
+        Advance every explosion one step in a single pass.
 
-        return self.duration <= 0
+        Args:
+            explosions (list): Active explosions
+            dt (int): Delta time in milliseconds
+
+        Returns:
+            tuple: (still burning, just finished) explosion lists
+        """
+        burning = []
+        finished = []
+        for explosion in explosions:
+            elapsed = explosion.elapsed + dt
+            explosion.elapsed = elapsed
+            explosion.frame = elapsed >> 6
+            if elapsed >= explosion.duration:
+                finished.append(explosion)
+            else:
+                burning.append(explosion)
+        return burning, finished
 
     def draw(self, screen):
         """Draw explosion effect with animation frames"""
-        if self.duration > 0:
-            try:
-                from assets.asset_loader import get_asset_loader
-                loader = get_asset_loader()
-                frames = loader.get_image('explosion_frames')
-
-                if frames and self.frame < len(frames):
-                    frame_surface = frames[self.frame]
-                    screen.blit(frame_surface, (self.x, self.y))
-                else:
-                    self._draw_fallback(screen)
-            except:
+        if self.elapsed < self.duration:
+            frames = self._frames
+            if frames and self.frame < len(frames):
+                screen.blit(frames[self.frame], (self.x, self.y))
+            else:
                 self._draw_fallback(screen)
 
     def _draw_fallback(self, screen):
-        """Fallback explosion drawing"""
-        # Create surface with alpha
-        explosion_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        alpha = int((self.duration / 500) * 255)
+        """Fallback explosion drawing (cached surface, per-frame alpha)"""
+        explosion_surface = _explosion_surf(self.direction)
+        alpha = int((self.duration - self.elapsed) * 255 // self.duration)
         explosion_surface.set_alpha(alpha)
-
-        # Draw explosion based on direction
-        if self.direction is None:
-            # Center explosion (circle)
-            pygame.draw.circle(explosion_surface, (255, 150, 0),
-                               (TILE_SIZE // 2, TILE_SIZE // 2),
-                               TILE_SIZE // 2)
-        else:
-            # Directional explosion (beam)
-            if self.direction in ['left', 'right']:
-                pygame.draw.rect(explosion_surface, (255, 150, 0),
-                                 (0, TILE_SIZE // 4, TILE_SIZE, TILE_SIZE // 2))
-            else:  # up or down
-                pygame.draw.rect(explosion_surface, (255, 150, 0),
-                                 (TILE_SIZE // 4, 0, TILE_SIZE // 2, TILE_SIZE))
-
         screen.blit(explosion_surface, (self.x, self.y))
\ No newline at end of file
@@ -4,6 +4,7 @@ Enemy model for the Bomberman game
 Uses Strategy Pattern for different AI behaviors
 """
 
+import numpy as np
 import pygame
 from config import TILE_SIZE, ENEMY_SPEED
 
@@ -13,6 +14,12 @@ class Enemy:
     Enemy class that can have different AI strategies.
     """
 
+    # Shared across instances: the AI-indicator font is created once and
+    # each rendered letter surface is memoized, instead of a fresh Font
+    # and text rasterization per enemy per frame
+    _font = None
+    _glyph_cache = {}
+
     def __init__(self, enemy_id, x, y, color, ai_strategy):
         """
         Initialize enemy.
@@ -36,8 +43,16 @@ class Enemy:
         # AI Strategy
         self.ai_strategy = ai_strategy
 
-        # Rectangle for collision
+        # AI pacing: re-plan every ai_period_ms and keep moving along the
+        # cached direction between plans, so pathfinding doesn't run every frame
+        self.ai_period_ms = 100
+        self._ai_accum = 0
+        self._ai_move = (0, 0)
+
+        # Rectangle for collision, plus a scratch rect reused for candidate
+        # positions so move() does not allocate a Rect per frame
         self.rect = pygame.Rect(self.x, self.y, TILE_SIZE - 4, TILE_SIZE - 4)
+        self._scratch_rect = self.rect.copy()
 
         # Animation
         self.animation_timer = 0
@@ -53,7 +68,7 @@ class Enemy:
         self.ai_strategy = ai_strategy
         print(f"Enemy {self.enemy_id} strategy changed to {ai_strategy.__class__.__name__}")
 
-    def update(self, dt, walls, players, enemies):
+    def update(self, dt, walls, players, enemies, wall_grid=None):
         """
         Update enemy position using AI strategy.
 
@@ -62,15 +77,38 @@ class Enemy:
             walls (list): List of walls
             players (list): List of players
             enemies (list): List of other enemies
+            wall_grid (list): Optional 2D tile index of live walls
         """
         if not self.alive:
             return
 
-        # Get movement direction from AI strategy
-        dx, dy = self.ai_strategy.calculate_move(self, walls, players, enemies)
+        self.plan(dt, walls, players, enemies)
 
-        # Move enemy
-        self.move(dx, dy, walls, enemies)
+        # Move enemy along the cached direction
+        dx, dy = self._ai_move
+        self.move(dx, dy, walls, enemies, wall_grid)
+
+    def plan(self, dt, walls, players, enemies):
+        """
+        Run the AI cadence and animation for one frame without moving.
+
+        Movement is applied separately (move or move_batch) so the
+        controller can batch the collision arithmetic across enemies.
+
+        Args:
+            dt (int): Delta time in milliseconds
+            walls (list): List of walls
+            players (list): List of players
+            enemies (list): List of other enemies
+        """
+        if not self.alive:
+            return
+
+        # Re-plan on this enemy's cadence; movement itself stays per-frame
+        self._ai_accum += dt
+        if self._ai_accum >= self.ai_period_ms:
+            self._ai_accum = 0
+            self._ai_move = self.ai_strategy.calculate_move(self, walls, players, enemies)
 
         # Update animation
         self.animation_timer += dt
@@ -78,7 +116,61 @@ class Enemy:
             self.animation_frame = (self.animation_frame + 1) % 2
             self.animation_timer = 0
 
-    def move(self, dx, dy, walls, enemies):
+    @classmethod
+    def move_batch(cls, enemies, block_mask):
+        """
+        Apply every living enemy's cached move in one vectorized pass.
+
+        Candidate positions and the four wall-tile probes per enemy are
+        computed as NumPy arrays against the controller's blocker mask,
+        so the collision arithmetic runs in C regardless of enemy count.
+        Only the enemy-vs-enemy check stays pairwise in Python.
+
+        Args:
+            enemies (list): All enemies (dead ones are skipped)
+            block_mask (np.ndarray): uint8 grid, non-zero where blocked
+        """
+        movers = [e for e in enemies if e.alive and e._ai_move != (0, 0)]
+        if not movers:
+            return
+
+        n = len(movers)
+        new_x = np.empty(n, dtype=np.int32)
+        new_y = np.empty(n, dtype=np.int32)
+        for i, enemy in enumerate(movers):
+            new_x[i] = enemy.x + enemy._ai_move[0] * enemy.speed
+            new_y[i] = enemy.y + enemy._ai_move[1] * enemy.speed
+
+        # Enemies share a tile-derived rect size, so one width/height
+        # pair covers the whole batch
+        w = movers[0].rect.width - 1
+        h = movers[0].rect.height - 1
+        grid_h, grid_w = block_mask.shape
+        x0 = np.clip(new_x // TILE_SIZE, 0, grid_w - 1)
+        x1 = np.clip((new_x + w) // TILE_SIZE, 0, grid_w - 1)
+        y0 = np.clip(new_y // TILE_SIZE, 0, grid_h - 1)
+        y1 = np.clip((new_y + h) // TILE_SIZE, 0, grid_h - 1)
+        blocked = (block_mask[y0, x0] | block_mask[y0, x1] |
+                   block_mask[y1, x0] | block_mask[y1, x1]) != 0
+
+        for i, enemy in enumerate(movers):
+            if blocked[i]:
+                continue
+            nx = int(new_x[i])
+            ny = int(new_y[i])
+            new_rect = enemy._scratch_rect
+            new_rect.x = nx
+            new_rect.y = ny
+            if any(other is not enemy and other.alive and
+                   new_rect.colliderect(other.rect) for other in enemies):
+                continue
+            enemy.x = nx
+            enemy.y = ny
+            enemy.rect.x = nx
+            enemy.rect.y = ny
+            enemy.update_grid_position()
+
+    def move(self, dx, dy, walls, enemies, wall_grid=None):
         """
         Move enemy with collision detection.
 
@@ -87,6 +179,7 @@ class Enemy:
             dy (int): Y direction (-1, 0, or 1)
             walls (list): List of walls
             enemies (list): List of other enemies
+            wall_grid (list): Optional 2D tile index of live walls
         """
         if not self.alive:
             return
@@ -94,14 +187,34 @@ class Enemy:
         # Calculate new position
         new_x = self.x + dx * self.speed
         new_y = self.y + dy * self.speed
-        new_rect = pygame.Rect(new_x, new_y, self.rect.width, self.rect.height)
+        new_rect = self._scratch_rect
+        new_rect.x = new_x
+        new_rect.y = new_y
 
         # Check collision with walls
         collision = False
-        for wall in walls:
-            if not wall.destroyed and new_rect.colliderect(wall.rect):
-                collision = True
-                break
+        if wall_grid is not None:
+            # Walls are tile-aligned, so the new rect overlaps at most
+            # four tiles; probe those instead of scanning the wall list
+            x0 = int(new_x) // TILE_SIZE
+            y0 = int(new_y) // TILE_SIZE
+            x1 = int(new_x + self.rect.width - 1) // TILE_SIZE
+            y1 = int(new_y + self.rect.height - 1) // TILE_SIZE
+            grid_h = len(wall_grid)
+            grid_w = len(wall_grid[0])
+            for gy in {y0, y1}:
+                for gx in {x0, x1}:
+                    if 0 <= gy < grid_h and 0 <= gx < grid_w and \
+                            wall_grid[gy][gx] is not None:
+                        collision = True
+                        break
+                if collision:
+                    break
+        else:
+            for wall in walls:
+                if not wall.destroyed and new_rect.colliderect(wall.rect):
+                    collision = True
+                    break
 
         # Check collision with other enemies
         for enemy in enemies:
@@ -156,8 +269,12 @@ class Enemy:
                             pygame.Rect(self.rect.centerx - 8, self.rect.centery + 2, 16, 8),
                             3.14, 0, 2)
 
-            # Draw AI type indicator
-            font = pygame.font.Font(None, 16)
-            ai_type = self.ai_strategy.__class__.__name__.replace('AIStrategy', '')
-            text = font.render(ai_type[0], True, (255, 255, 255))
+            # Draw AI type indicator (cached font and glyph surfaces)
+            if Enemy._font is None:
+                Enemy._font = pygame.font.Font(None, 16)
+            ai_letter = self.ai_strategy.__class__.__name__[0]
+            text = Enemy._glyph_cache.get(ai_letter)
+            if text is None:
+                text = Enemy._font.render(ai_letter, True, (255, 255, 255))
+                Enemy._glyph_cache[ai_letter] = text
             screen.blit(text, (self.rect.x + 2, self.rect.y + 2))
\ No newline at end of file
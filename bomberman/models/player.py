@@ -9,6 +9,66 @@ from config import TILE_SIZE, PLAYER_SPEED, INITIAL_BOMB_COUNT, INITIAL_BOMB_POW
 from patterns.behavioral.state import PlayerStateManager
 
 
+# Facing direction by movement sign pair; diagonals keep the horizontal
+# precedence the old if/elif chain had. draw() reads matching eye offsets
+_DIR_TABLE = {
+    (1, 0): 'right', (1, 1): 'right', (1, -1): 'right',
+    (-1, 0): 'left', (-1, 1): 'left', (-1, -1): 'left',
+    (0, 1): 'down', (0, -1): 'up',
+}
+
+# Shared label font, created lazily once pygame.font is initialized
+_font = None
+
+
+def _get_font():
+    global _font
+    if _font is None:
+        _font = pygame.font.Font(None, 20)
+    return _font
+
+
+# Eye center offsets (from the body center) per facing direction
+_EYE_OFFSETS = {
+    'right': ((5, -3), (5, 3)),
+    'left': ((-5, -3), (-5, 3)),
+    'up': ((-3, -5), (3, -5)),
+    'down': ((-3, 5), (3, 5)),
+}
+
+
+def resolve_move(x, y, dx, dy, speed, width, height, block_mask):
+    """
+    Resolve one movement step against the wall block mask.
+
+    Pure integer/array arithmetic with no game objects, in the same
+    JIT-friendly shape as the explosion propagate() kernel; Player.move
+    supplies its state and applies the result.
+
+    Args:
+        x (int): Current pixel X
+        y (int): Current pixel Y
+        dx (int): X direction (-1, 0, or 1)
+        dy (int): Y direction (-1, 0, or 1)
+        speed (int): Pixels per step
+        width (int): Collision rect width
+        height (int): Collision rect height
+        block_mask (np.ndarray): uint8 grid, non-zero where blocked
+
+    Returns:
+        tuple: (new_x, new_y, collided)
+    """
+    new_x = x + dx * speed
+    new_y = y + dy * speed
+    # The rect is smaller than a tile, so it overlaps at most four cells
+    x0 = max(int(new_x) // TILE_SIZE, 0)
+    y0 = max(int(new_y) // TILE_SIZE, 0)
+    x1 = int(new_x + width - 1) // TILE_SIZE
+    y1 = int(new_y + height - 1) // TILE_SIZE
+    collided = bool(block_mask[y0:y1 + 1, x0:x1 + 1].any())
+    return new_x, new_y, collided
+
+
 class Player:
     """
     Player class representing a player in the game.
@@ -40,12 +100,19 @@ class Player:
         self.bomb_power = INITIAL_BOMB_POWER
         self.bombs_placed = 0
 
-        # Rectangle for collision detection
+        # Rectangle for collision detection, plus a scratch rect reused for
+        # candidate positions so move() does not allocate a Rect per frame
         self.rect = pygame.Rect(self.x, self.y, TILE_SIZE - 4, TILE_SIZE - 4)
+        self._scratch_rect = self.rect.copy()
 
         # Animation
         self.direction = 'down'  # Current facing direction
-        
+
+        # ID label never changes, so it is rendered once here instead of
+        # building a Font and rasterizing text every frame
+        self._label_surface = _get_font().render(f"P{player_id}", True, (255, 255, 255))
+
+
         # State Pattern Implementation
         self.state_manager = PlayerStateManager(self)
         self.state_manager.set_normal_state()
@@ -55,7 +122,7 @@ class Player:
         self.grid_x = self.x // TILE_SIZE
         self.grid_y = self.y // TILE_SIZE
 
-    def move(self, dx, dy, walls):
+    def move(self, dx, dy, walls, block_mask=None):
         """
         Move player with classic Bomberman mechanics:
         - Axis locking for smooth transitions
@@ -65,25 +132,19 @@ class Player:
             dx (int): X direction (-1, 0, or 1)
             dy (int): Y direction (-1, 0, or 1)
             walls (list): List of wall objects to check collision
+            block_mask (np.ndarray): Optional uint8 grid of live walls
+                (non-zero means blocked)
         """
-        # Check if stunned - if so, don't allow movement
-        if hasattr(self.state_manager.current_state, '__class__'):
-            state_name = self.state_manager.current_state.get_state_name()
-            if 'Stunned' in state_name:
-                dx = dy = 0
-        
-        if not self.state_manager.is_alive():
+        # Stunned players stay put but still settle into the grid
+        if self.state_manager.movement_blocked:
+            dx = dy = 0
+
+        if not self.state_manager.alive:
             return
 
-        # Update direction
-        if dx > 0:
-            self.direction = 'right'
-        elif dx < 0:
-            self.direction = 'left'
-        elif dy > 0:
-            self.direction = 'down'
-        elif dy < 0:
-            self.direction = 'up'
+        # Update direction via the sign-pair lookup table
+        key = ((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))
+        self.direction = _DIR_TABLE.get(key, self.direction)
 
         # Simple axis locking: align to grid on perpendicular axis BEFORE moving
         align_threshold = 8
@@ -100,17 +161,23 @@ class Player:
                 self.x = grid_center_x
                 self.rect.x = self.x
 
-        # Calculate new position
-        new_x = self.x + dx * self.speed
-        new_y = self.y + dy * self.speed
-        new_rect = pygame.Rect(new_x, new_y, self.rect.width, self.rect.height)
-
-        # Check collision with walls
-        collision = False
-        for wall in walls:
-            if not wall.destroyed and new_rect.colliderect(wall.rect):
-                collision = True
-                break
+        # Resolve the step: the mask path runs through the standalone
+        # arithmetic kernel; the list path remains for callers without one
+        if block_mask is not None:
+            new_x, new_y, collision = resolve_move(
+                self.x, self.y, dx, dy, self.speed,
+                self.rect.width, self.rect.height, block_mask)
+        else:
+            new_x = self.x + dx * self.speed
+            new_y = self.y + dy * self.speed
+            new_rect = self._scratch_rect
+            new_rect.x = new_x
+            new_rect.y = new_y
+            collision = False
+            for wall in walls:
+                if not wall.destroyed and new_rect.colliderect(wall.rect):
+                    collision = True
+                    break
 
         # Update position if no collision
         if not collision:
@@ -176,28 +243,14 @@ class Player:
                                (self.rect.centerx, self.rect.centery),
                                TILE_SIZE // 3)
 
-            # Draw player eyes based on direction
-            eye_offset = 5
-            if self.direction == 'right':
-                eye1 = (self.rect.centerx + eye_offset, self.rect.centery - 3)
-                eye2 = (self.rect.centerx + eye_offset, self.rect.centery + 3)
-            elif self.direction == 'left':
-                eye1 = (self.rect.centerx - eye_offset, self.rect.centery - 3)
-                eye2 = (self.rect.centerx - eye_offset, self.rect.centery + 3)
-            elif self.direction == 'up':
-                eye1 = (self.rect.centerx - 3, self.rect.centery - eye_offset)
-                eye2 = (self.rect.centerx + 3, self.rect.centery - eye_offset)
-            else:  # down
-                eye1 = (self.rect.centerx - 3, self.rect.centery + eye_offset)
-                eye2 = (self.rect.centerx + 3, self.rect.centery + eye_offset)
-
-            pygame.draw.circle(screen, (0, 0, 0), eye1, 2)
-            pygame.draw.circle(screen, (0, 0, 0), eye2, 2)
+            # Draw player eyes from the per-direction offset table
+            cx, cy = self.rect.centerx, self.rect.centery
+            (ox1, oy1), (ox2, oy2) = _EYE_OFFSETS[self.direction]
+            pygame.draw.circle(screen, (0, 0, 0), (cx + ox1, cy + oy1), 2)
+            pygame.draw.circle(screen, (0, 0, 0), (cx + ox2, cy + oy2), 2)
             
             # Draw state indicator (invincible = glow, stunned = red border)
             self.state_manager.draw_state_indicator(screen, self.rect)
 
             # Draw player ID
-            font = pygame.font.Font(None, 20)
-            text = font.render(f"P{self.player_id}", True, (255, 255, 255))
-            screen.blit(text, (self.rect.x + 5, self.rect.y + 5))
\ No newline at end of file
+            screen.blit(self._label_surface, (self.rect.x + 5, self.rect.y + 5))
\ No newline at end of file
@@ -6,14 +6,22 @@ Implements Decorator Pattern for dynamic ability enhancement
 
 import pygame
 from config import TILE_SIZE
-from abc import ABC, abstractmethod
 
 
-class PowerUp(ABC):
+class PowerUp:
     """
-    Abstract base class for power-ups.
+    Base class for power-ups.
+    Subclasses must provide apply and get_symbol. A plain base class
+    instead of abc.ABC keeps isinstance checks and the MRO free of
+    metaclass machinery.
     """
 
+    # Shared across instances: the symbol font is created once and each
+    # rendered symbol surface is memoized, instead of a fresh Font and
+    # text rasterization per power-up per frame
+    _font = None
+    _symbol_cache = {}
+
     def __init__(self, x, y, color, name):
         """
         Initialize power-up.
@@ -33,17 +41,19 @@ class PowerUp(ABC):
         self.rect = pygame.Rect(self.x + 5, self.y + 5, TILE_SIZE - 10, TILE_SIZE - 10)
         self.collected = False
 
+        # Draw-time constant, computed once instead of per frame
+        self.bright_color = tuple(min(c + 80, 255) for c in color)
+
         # Animation
         self.float_offset = 0
         self.float_speed = 2
 
-    @abstractmethod
     def apply(self, player):
         """
         Apply power-up effect to player using Decorator Pattern.
         This wraps the player with appropriate decorators.
         """
-        pass
+        raise NotImplementedError
 
     def update(self, dt):
         """Update power-up animation"""
@@ -59,23 +69,26 @@ class PowerUp(ABC):
             draw_rect = pygame.Rect(self.x + 5, draw_y + 5, TILE_SIZE - 10, TILE_SIZE - 10)
 
             # Draw power-up with enhanced brightness
-            bright_color = tuple(min(c + 80, 255) for c in self.color)
-            pygame.draw.circle(screen, bright_color, draw_rect.center, 12)
+            pygame.draw.circle(screen, self.bright_color, draw_rect.center, 12)
             pygame.draw.circle(screen, (255, 255, 255), draw_rect.center, 12, 2)
-            
-            # Draw glow effect
-            pygame.draw.circle(screen, bright_color, draw_rect.center, 14, 1)
 
-            # Draw symbol
-            font = pygame.font.Font(None, 20)
-            text = font.render(self.get_symbol(), True, (255, 255, 255))
+            # Draw glow effect
+            pygame.draw.circle(screen, self.bright_color, draw_rect.center, 14, 1)
+
+            # Draw symbol (cached font and rendered surfaces)
+            if PowerUp._font is None:
+                PowerUp._font = pygame.font.Font(None, 20)
+            symbol = self.get_symbol()
+            text = PowerUp._symbol_cache.get(symbol)
+            if text is None:
+                text = PowerUp._font.render(symbol, True, (255, 255, 255))
+                PowerUp._symbol_cache[symbol] = text
             text_rect = text.get_rect(center=draw_rect.center)
             screen.blit(text, text_rect)
 
-    @abstractmethod
     def get_symbol(self):
         """Return symbol character for this power-up"""
-        pass
+        raise NotImplementedError
 
 
 class BombCountPowerUp(PowerUp):
@@ -5,14 +5,15 @@ Three types: Unbreakable, Breakable, Hard
 """
 
 import pygame
-from abc import ABC, abstractmethod
 from config import TILE_SIZE
 
 
-class Wall(ABC):
+class Wall:
     """
-    Abstract base class for all wall types.
-    Implements common wall functionality.
+    Base class for all wall types.
+    Implements common wall functionality; subclasses must provide
+    take_damage and get_type. A plain base class instead of abc.ABC
+    keeps isinstance checks and the MRO free of metaclass machinery.
     """
 
     def __init__(self, x, y, color):
@@ -24,18 +25,16 @@ class Wall(ABC):
         self.rect = pygame.Rect(self.x, self.y, TILE_SIZE, TILE_SIZE)
         self.destroyed = False
 
-    @abstractmethod
     def take_damage(self):
         """
-        Abstract method to handle damage.
+        Handle damage.
         Each wall type implements this differently.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_type(self):
         """Return the wall type as string"""
-        pass
+        raise NotImplementedError
 
     def draw(self, screen):
         """Draw the wall on screen"""
@@ -90,14 +89,18 @@ class HardWall(Wall):
         self.max_health = 3
         self.health = self.max_health
         self.original_color = color
+        # One darkened color per remaining health level, computed once
+        self._damage_colors = [
+            tuple(int(c * health / self.max_health) for c in color)
+            for health in range(self.max_health + 1)
+        ]
 
     def take_damage(self):
         """Reduce health, destroy when health reaches 0"""
         if self.health > 0:
             self.health -= 1
             # Change color to show damage
-            darker_factor = self.health / self.max_health
-            self.color = tuple(int(c * darker_factor) for c in self.original_color)
+            self.color = self._damage_colors[self.health]
 
             if self.health <= 0:
                 self.destroyed = True
@@ -4,9 +4,48 @@ Game Server for Online Multiplayer
 Uses Facade Pattern for simplified network operations
 """
 
+import time
+
 from patterns.structural.facade import ServerFacade
 from config import SERVER_HOST, SERVER_PORT
 
+# Minimum gap between forwarded duplicate packets. Clients resend at
+# most once per ~16.7 ms frame, so the window spans several frames;
+# dropping is safe because an identical packet re-applies the exact same
+# state on the opponent's board. Anything new is relayed immediately
+MIN_RELAY_INTERVAL_NS = 200_000_000
+
+
+class ClientInfo:
+    """
+    Per-connection record.
+    Slots make the per-packet field reads plain attribute loads instead
+    of string-keyed dict lookups.
+    """
+
+    __slots__ = ('username', 'player_number', 'game_id', 'opponent_id',
+                 'last_move', 'last_move_ns', 'last_bomb', 'last_bomb_ns')
+
+    def __init__(self, username):
+        self.username = username
+        self.player_number = None
+        self.game_id = None
+        self.opponent_id = None
+        # Last forwarded move/bomb state, for relay dedup
+        self.last_move = None
+        self.last_move_ns = 0
+        self.last_bomb = None
+        self.last_bomb_ns = 0
+
+
+class GameInfo:
+    """Per-game record"""
+
+    __slots__ = ('players',)
+
+    def __init__(self, players):
+        self.players = players
+
 
 class GameServer:
     """
@@ -16,8 +55,8 @@ class GameServer:
     def __init__(self, host=SERVER_HOST, port=SERVER_PORT):
         """Initialize game server"""
         self.facade = ServerFacade(host, port)
-        self.games = {}  # game_id -> game_data
-        self.clients = {}  # client_id -> player_data
+        self.games = {}  # game_id -> GameInfo
+        self.clients = {}  # client_id -> ClientInfo
         self.waiting_players = []
 
         # Register message handlers
@@ -58,11 +97,7 @@ class GameServer:
             'username': username
         })
 
-        self.clients[client_id] = {
-            'username': username,
-            'player_number': None,
-            'game_id': None
-        }
+        self.clients[client_id] = ClientInfo(username)
 
         # If 2 players waiting, start game
         if len(self.waiting_players) >= 2:
@@ -86,16 +121,17 @@ class GameServer:
         print(f"   Player 2: {player2['username']} (Client {player2['client_id']})")
 
         # Setup game data
-        self.games[game_id] = {
-            'players': [player1, player2],
-            'started': True
-        }
-
-        # Update client data
-        self.clients[player1['client_id']]['player_number'] = 1
-        self.clients[player1['client_id']]['game_id'] = game_id
-        self.clients[player2['client_id']]['player_number'] = 2
-        self.clients[player2['client_id']]['game_id'] = game_id
+        self.games[game_id] = GameInfo((player1, player2))
+
+        # Update client data; opponent_id gives relay handlers a direct link
+        info1 = self.clients[player1['client_id']]
+        info2 = self.clients[player2['client_id']]
+        info1.player_number = 1
+        info1.game_id = game_id
+        info1.opponent_id = player2['client_id']
+        info2.player_number = 2
+        info2.game_id = game_id
+        info2.opponent_id = player1['client_id']
 
         # Send game start to both players
         self.facade.send_to_client(player1['client_id'], 'game_start', {
@@ -113,87 +149,82 @@ class GameServer:
         print(f"   ✅ Game {game_id} started!\n")
 
     def _handle_player_move(self, data):
-        """Handle player movement and broadcast to opponent"""
-        client_id = data.get('client_id')
-
-        if client_id not in self.clients:
+        """Handle player movement and relay to opponent"""
+        info = self.clients.get(data.get('client_id'))
+        if info is None or info.opponent_id is None:
             return
 
-        game_id = self.clients[client_id]['game_id']
-        if not game_id or game_id not in self.games:
+        # Drop packets that repeat the last forwarded position and
+        # direction inside the relay window; the client already sends
+        # grid coordinates, so the values are compared as-is. A held key
+        # inside one tile then costs one packet per window while tile or
+        # direction changes go out immediately
+        now = time.monotonic_ns()
+        move = (data.get('x'), data.get('y'), data.get('direction'))
+        if move == info.last_move and now - info.last_move_ns < MIN_RELAY_INTERVAL_NS:
             return
+        info.last_move = move
+        info.last_move_ns = now
 
-        # Broadcast to other player in the game
-        game = self.games[game_id]
-        for player in game['players']:
-            if player['client_id'] != client_id:
-                self.facade.send_to_client(player['client_id'], 'opponent_move', data)
+        self.facade.send_to_client(info.opponent_id, 'opponent_move', data)
 
     def _handle_bomb_placed(self, data):
-        """Handle bomb placement and broadcast"""
-        client_id = data.get('client_id')
-
-        if client_id not in self.clients:
+        """Handle bomb placement and relay to opponent"""
+        info = self.clients.get(data.get('client_id'))
+        if info is None or info.opponent_id is None:
             return
 
-        game_id = self.clients[client_id]['game_id']
-        if not game_id or game_id not in self.games:
+        # Same dedup by cell only (already grid coordinates); the bomb
+        # timer is far longer than the window, so a repeat bomb in the
+        # same cell this soon can only be a duplicate packet
+        now = time.monotonic_ns()
+        cell = (data.get('x'), data.get('y'))
+        if cell == info.last_bomb and now - info.last_bomb_ns < MIN_RELAY_INTERVAL_NS:
             return
+        info.last_bomb = cell
+        info.last_bomb_ns = now
 
-        # Broadcast to other player
-        game = self.games[game_id]
-        for player in game['players']:
-            if player['client_id'] != client_id:
-                self.facade.send_to_client(player['client_id'], 'opponent_bomb', data)
+        self.facade.send_to_client(info.opponent_id, 'opponent_bomb', data)
 
     def _handle_player_died(self, data):
-        """Handle player death and broadcast"""
-        client_id = data.get('client_id')
-
-        if client_id not in self.clients:
-            return
-
-        game_id = self.clients[client_id]['game_id']
-        if not game_id or game_id not in self.games:
+        """Handle player death and relay to opponent"""
+        info = self.clients.get(data.get('client_id'))
+        if info is None or info.opponent_id is None:
             return
 
-        player_number = self.clients[client_id]['player_number']
+        print(f"💀 Player {info.player_number} died in Game {info.game_id}")
 
-        print(f"💀 Player {player_number} died in Game {game_id}")
-
-        # Broadcast to other player
-        game = self.games[game_id]
-        for player in game['players']:
-            if player['client_id'] != client_id:
-                self.facade.send_to_client(player['client_id'], 'opponent_died', {
-                    'player_number': player_number
-                })
+        self.facade.send_to_client(info.opponent_id, 'opponent_died', {
+            'player_number': info.player_number
+        })
 
         # End game
-        self._end_game(game_id)
+        self._end_game(info.game_id)
 
     def _handle_disconnect(self, data):
         """Handle player disconnection"""
         client_id = data.get('client_id')
 
-        if client_id in self.clients:
-            username = self.clients[client_id]['username']
-            game_id = self.clients[client_id]['game_id']
-
-            print(f"⚠️ Player '{username}' disconnected (Client {client_id})")
+        info = self.clients.get(client_id)
+        if info is not None:
+            print(f"⚠️ Player '{info.username}' disconnected (Client {client_id})")
 
             # Remove from waiting list
             self.waiting_players = [p for p in self.waiting_players if p['client_id'] != client_id]
 
             # End game if in progress
-            if game_id and game_id in self.games:
-                self._end_game(game_id)
+            if info.game_id and info.game_id in self.games:
+                self._end_game(info.game_id)
 
             del self.clients[client_id]
 
     def _end_game(self, game_id):
         """End a game"""
         if game_id in self.games:
+            for player in self.games[game_id].players:
+                info = self.clients.get(player['client_id'])
+                if info is not None:
+                    info.opponent_id = None
             print(f"🏁 Game {game_id} ended\n")
             del self.games[game_id]
 
@@ -51,16 +51,22 @@ class Subject:
 
     def __init__(self):
         self._observers = []
+        self._by_event = {}
 
-    def attach(self, observer):
+    def attach(self, observer, event_types=None):
         """
         Add an observer to the subscription list.
 
         Args:
             observer (Observer): Observer to add
+            event_types (iterable): GameEvents the observer cares about.
+                Defaults to all events, matching the old behavior.
         """
         if observer not in self._observers:
             self._observers.append(observer)
+            events = list(GameEvent) if event_types is None else event_types
+            for event in events:
+                self._by_event.setdefault(event, []).append(observer)
             print(f"✅ Observer {observer.__class__.__name__} attached")
 
     def detach(self, observer):
@@ -72,17 +78,20 @@ class Subject:
         """
         if observer in self._observers:
             self._observers.remove(observer)
+            for observers in self._by_event.values():
+                if observer in observers:
+                    observers.remove(observer)
             print(f"❌ Observer {observer.__class__.__name__} detached")
 
     def notify(self, event, data=None):
         """
-        Notify all observers about an event.
+        Notify observers subscribed to an event.
 
         Args:
             event (GameEvent): The event that occurred
             data (dict): Additional data about the event
         """
-        for observer in self._observers:
+        for observer in self._by_event.get(event, ()):
             observer.update(event, data)
 
 
@@ -233,11 +233,17 @@ class PlayerStateManager:
     def __init__(self, player):
         self.player = player
         self.current_state = NormalState(player)
+        # Flags cached on every transition so hot paths read plain
+        # attributes instead of isinstance checks or state-name scans
+        self.alive = True
+        self.movement_blocked = False
 
     def change_state(self, new_state):
         """Change to a new state"""
         old_state_name = self.current_state.get_state_name()
         self.current_state = new_state
+        self.alive = not isinstance(new_state, DeadState)
+        self.movement_blocked = isinstance(new_state, (StunnedState, DeadState))
         new_state_name = self.current_state.get_state_name()
         print(f"Player {self.player.player_id} state: {old_state_name} → {new_state_name}")
 
@@ -263,7 +269,7 @@ class PlayerStateManager:
     
     def is_alive(self):
         """Check if player is alive (not in DeadState)"""
-        return not isinstance(self.current_state, DeadState)
+        return self.alive
     
     def set_normal_state(self):
         """Set player to normal state"""
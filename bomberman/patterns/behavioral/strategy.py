@@ -5,9 +5,12 @@ Different AI strategies for enemy movement
 """
 
 from abc import ABC, abstractmethod
+import heapq
 import random
 import math
 
+from config import GRID_WIDTH, GRID_HEIGHT
+
 
 class AIStrategy(ABC):
     """
@@ -185,20 +188,20 @@ class IntelligentAIStrategy(AIStrategy):
             if not wall.destroyed:
                 wall_grid.add((wall.grid_x, wall.grid_y))
 
-        # A* implementation
-        open_set = [start]
+        # A* with a binary heap frontier: pop-min and membership are
+        # O(log n)/O(1) instead of the linear scans a plain list needs
+        open_heap = [(self._heuristic(start, goal), start)]
         came_from = {}
         g_score = {start: 0}
-        f_score = {start: self._heuristic(start, goal)}
+        closed = set()
 
         max_iterations = 100  # Prevent infinite loops
         iterations = 0
 
-        while open_set and iterations < max_iterations:
+        while open_heap and iterations < max_iterations:
             iterations += 1
 
-            # Find node with lowest f_score
-            current = min(open_set, key=lambda pos: f_score.get(pos, float('inf')))
+            current = heapq.heappop(open_heap)[1]
 
             if current == goal:
                 # Reconstruct path
@@ -209,10 +212,13 @@ class IntelligentAIStrategy(AIStrategy):
                 path.reverse()
                 return path
 
-            open_set.remove(current)
+            # Stale heap entries from re-pushed nodes are skipped here
+            if current in closed:
+                continue
+            closed.add(current)
 
             # Check neighbors
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
                 neighbor = (current[0] + dx, current[1] + dy)
 
                 # Skip if wall
@@ -220,7 +226,7 @@ class IntelligentAIStrategy(AIStrategy):
                     continue
 
                 # Skip if out of bounds
-                if neighbor[0] < 0 or neighbor[0] >= 20 or neighbor[1] < 0 or neighbor[1] >= 15:
+                if not (0 <= neighbor[0] < GRID_WIDTH and 0 <= neighbor[1] < GRID_HEIGHT):
                     continue
 
                 tentative_g_score = g_score[current] + 1
@@ -228,10 +234,9 @@ class IntelligentAIStrategy(AIStrategy):
                 if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + self._heuristic(neighbor, goal)
-
-                    if neighbor not in open_set:
-                        open_set.append(neighbor)
+                    heapq.heappush(open_heap,
+                                   (tentative_g_score + self._heuristic(neighbor, goal),
+                                    neighbor))
 
         # No path found, return empty
         return []
@@ -4,18 +4,23 @@ Singleton Pattern - Database Connection
 Ensures only one database connection instance exists throughout the application
 """
 
+import logging
+
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, pooling
 from config import DB_CONFIG
 
+logger = logging.getLogger(__name__)
+
 
 class DatabaseConnection:
     """
-    Singleton class for managing database connection.
-    Only one instance of database connection will exist.
+    Singleton class for managing database connections.
+    Only one connection pool will exist; callers borrow connections
+    from it and close() them to hand them back.
     """
     _instance = None
-    _connection = None
+    _pool = None
 
     def __new__(cls):
         """
@@ -28,23 +33,27 @@ class DatabaseConnection:
 
     def get_connection(self):
         """
-        Returns the database connection.
-        Creates a new connection if one doesn't exist.
+        Returns a connection borrowed from the pool.
+        The pool is created lazily on first use. Closing the returned
+        connection gives it back to the pool instead of tearing it down.
         """
-        if self._connection is None or not self._connection.is_connected():
+        if self._pool is None:
             try:
-                self._connection = mysql.connector.connect(**DB_CONFIG)
-                print("✅ Database connection established (Singleton)")
+                self._pool = pooling.MySQLConnectionPool(
+                    pool_name="bomberman", pool_size=8, **DB_CONFIG)
+                logger.debug("Database connection pool created (Singleton)")
             except Error as e:
-                print(f"❌ Database connection error: {e}")
+                logger.error("Database connection error: %s", e)
                 return None
-        return self._connection
+        try:
+            return self._pool.get_connection()
+        except Error as e:
+            logger.error("Database connection error: %s", e)
+            return None
 
     def close_connection(self):
-        """Close the database connection"""
-        if self._connection and self._connection.is_connected():
-            self._connection.close()
-            print("🔒 Database connection closed")
+        """Pooled connections are returned via their own close()"""
+        logger.debug("Database connections are pooled; nothing to close")
 
 
 # Usage Example:
@@ -61,4 +70,5 @@ if __name__ == "__main__":
         cursor.execute("SELECT DATABASE();")
         result = cursor.fetchone()
         print(f"Connected to database: {result}")
-        cursor.close()
\ No newline at end of file
+        cursor.close()
+        conn.close()  # back to the pool
\ No newline at end of file
@@ -6,9 +6,23 @@ Provides a simplified interface for complex network operations
 
 import socket
 import json
+import struct
 import threading
 
 
+# Binary fast path for the fixed-layout gameplay packets: one type byte
+# (kept below 0x20 so it can never collide with the '{' that opens a
+# JSON line), then little-endian fields. Everything with variable
+# content (join_game, game_start, ...) stays newline-delimited JSON
+MSG_MOVE = 0x01
+MSG_BOMB = 0x02
+MOVE_STRUCT = struct.Struct('<BiiB')  # type, x, y, direction code
+BOMB_STRUCT = struct.Struct('<BiiB')  # type, x, y, power
+
+DIRECTIONS = ('up', 'down', 'left', 'right')
+DIR_CODE = {name: code for code, name in enumerate(DIRECTIONS)}
+
+
 class NetworkFacade:
     """
     Facade that simplifies network operations.
@@ -145,25 +159,39 @@ class NetworkFacade:
         except Exception as e:
             print(f"❌ Message processing error: {e}")
 
+    def _send_raw(self, payload):
+        """Send pre-packed bytes without the JSON envelope"""
+        if not self.connected:
+            print("❌ Not connected to server")
+            return False
+
+        try:
+            self.socket.sendall(payload)
+            return True
+
+        except Exception as e:
+            print(f"❌ Send failed: {e}")
+            self.connected = False
+            return False
+
     # High-level game-specific methods
 
     def send_player_move(self, player_id, x, y, direction):
-        """Send player movement"""
-        return self.send_message('player_move', {
-            'player_id': player_id,
-            'x': x,
-            'y': y,
-            'direction': direction
-        })
+        """Send player movement as a packed binary frame"""
+        code = DIR_CODE.get(direction)
+        if code is None:
+            # Unknown direction string: fall back to the JSON envelope
+            return self.send_message('player_move', {
+                'player_id': player_id,
+                'x': x,
+                'y': y,
+                'direction': direction
+            })
+        return self._send_raw(MOVE_STRUCT.pack(MSG_MOVE, x, y, code))
 
     def send_bomb_placed(self, player_id, x, y, power):
-        """Send bomb placement"""
-        return self.send_message('bomb_placed', {
-            'player_id': player_id,
-            'x': x,
-            'y': y,
-            'power': power
-        })
+        """Send bomb placement as a packed binary frame"""
+        return self._send_raw(BOMB_STRUCT.pack(MSG_BOMB, x, y, power))
 
     def send_player_died(self, player_id):
         """Send player death"""
@@ -262,19 +290,15 @@ class ServerFacade:
 
     def _handle_client(self, client_id, client_socket):
         """Handle messages from a client"""
-        buffer = ""
+        buffer = b""
 
         while self.running:
             try:
-                data = client_socket.recv(4096).decode()
+                data = client_socket.recv(4096)
                 if not data:
                     break
 
-                buffer += data
-
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    self._process_client_message(client_id, line)
+                buffer = self._drain_buffer(client_id, buffer + data)
 
             except Exception as e:
                 print(f"❌ Client {client_id} error: {e}")
@@ -283,17 +307,52 @@ class ServerFacade:
         # Client disconnected
         self._remove_client(client_id)
 
+    def _drain_buffer(self, client_id, buffer):
+        """
+        Consume complete frames from the client's byte buffer.
+
+        Binary frames are recognized by their leading type byte and
+        unpacked directly; anything else is a newline-delimited JSON
+        message. Returns the unconsumed remainder.
+        """
+        while buffer:
+            first = buffer[0]
+            if first == MSG_MOVE:
+                if len(buffer) < MOVE_STRUCT.size:
+                    break
+                _, x, y, code = MOVE_STRUCT.unpack_from(buffer)
+                buffer = buffer[MOVE_STRUCT.size:]
+                self._dispatch(client_id, 'player_move', {
+                    'x': x, 'y': y, 'direction': DIRECTIONS[code]
+                })
+            elif first == MSG_BOMB:
+                if len(buffer) < BOMB_STRUCT.size:
+                    break
+                _, x, y, power = BOMB_STRUCT.unpack_from(buffer)
+                buffer = buffer[BOMB_STRUCT.size:]
+                self._dispatch(client_id, 'bomb_placed', {
+                    'x': x, 'y': y, 'power': power
+                })
+            else:
+                newline = buffer.find(b'\n')
+                if newline < 0:
+                    break
+                line, buffer = buffer[:newline], buffer[newline + 1:]
+                self._process_client_message(client_id, line.decode())
+        return buffer
+
+    def _dispatch(self, client_id, message_type, data):
+        """Tag the message with its client and call its handler"""
+        data['client_id'] = client_id
+
+        if message_type in self.message_handlers:
+            self.message_handlers[message_type](data)
+
     def _process_client_message(self, client_id, message_str):
-        """Process message from client"""
+        """Process JSON message from client"""
         try:
             message = json.loads(message_str)
-            message_type = message.get('type')
-            data = message.get('data', {})
-            data['client_id'] = client_id  # Add client ID
-
-            # Call registered handler
-            if message_type in self.message_handlers:
-                self.message_handlers[message_type](data)
+            self._dispatch(client_id, message.get('type'), message.get('data', {}))
 
         except Exception as e:
             print(f"❌ Message processing error: {e}")
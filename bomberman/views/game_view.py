@@ -26,6 +26,12 @@ class GameView:
         self.font_medium = pygame.font.Font(None, 32)
         self.font_large = pygame.font.Font(None, 48)
 
+        # Background fill, grid lines and unbreakable walls never change
+        # during a game, so they are baked into one surface per wall set
+        # and blitted whole each frame
+        self._static_layer = None
+        self._static_layer_key = None
+
     def render(self, game_state):
         """
         Render the entire game state.
@@ -33,11 +39,11 @@ class GameView:
         Args:
             game_state (dict): Current game state from controller
         """
-        # Clear screen
-        self.screen.fill((50, 50, 50))
-
-        # Draw grid
-        self._draw_grid()
+        # Background, grid and permanent walls in one blit
+        self.screen.blit(
+            self._get_static_layer(game_state['walls'],
+                                   game_state['map_token']),
+            (0, 0))
 
         # Draw game objects
         self._draw_walls(game_state['walls'])
@@ -61,17 +67,36 @@ class GameView:
         # Update display
         pygame.display.flip()
 
-    def _draw_grid(self):
-        """Draw background grid"""
-        for x in range(0, SCREEN_WIDTH, TILE_SIZE):
-            pygame.draw.line(self.screen, (70, 70, 70), (x, 0), (x, SCREEN_HEIGHT))
-        for y in range(0, SCREEN_HEIGHT, TILE_SIZE):
-            pygame.draw.line(self.screen, (70, 70, 70), (0, y), (SCREEN_WIDTH, y))
+    def _get_static_layer(self, walls, map_token):
+        """
+        Get the pre-rendered background layer for this wall set,
+        rebuilding it only when a new game supplies a new map.
+
+        Args:
+            walls (list): The controller's wall list
+            map_token (int): The controller's map generation token
+
+        Returns:
+            pygame.Surface: Fill + grid + unbreakable walls, pre-drawn
+        """
+        if self._static_layer_key != map_token:
+            layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            layer.fill((50, 50, 50))
+            for x in range(0, SCREEN_WIDTH, TILE_SIZE):
+                pygame.draw.line(layer, (70, 70, 70), (x, 0), (x, SCREEN_HEIGHT))
+            for y in range(0, SCREEN_HEIGHT, TILE_SIZE):
+                pygame.draw.line(layer, (70, 70, 70), (0, y), (SCREEN_WIDTH, y))
+            for wall in walls:
+                if wall.get_type() == 'unbreakable':
+                    wall.draw(layer)
+            self._static_layer = layer
+            self._static_layer_key = map_token
+        return self._static_layer
 
     def _draw_walls(self, walls):
-        """Draw walls"""
+        """Draw destructible walls (permanent ones live on the static layer)"""
         for wall in walls:
-            if not wall.destroyed:
+            if not wall.destroyed and wall.get_type() != 'unbreakable':
                 wall.draw(self.screen)
 
     def _draw_explosions(self, explosions):